@@ -7,7 +7,7 @@ import os
 import pkgutil
 import textwrap
 from collections import defaultdict
-from typing import Dict, List, Set
+from typing import Dict, List
 
 import typer
 
@@ -32,7 +32,7 @@ for loader, module_name, is_pkg in pkgutil.walk_packages(
 INDENT = " " * 4
 
 
-def get_import_paths(sqls: Set[GenericSql]) -> Dict[str, List[str]]:
+def get_import_paths(sqls: List[GenericSql]) -> Dict[str, List[str]]:
     module_map = defaultdict(list)
     # Find their import paths
     for node in sqls:
@@ -49,7 +49,7 @@ def generate_import_statements(module_map: Dict[str, List[str]]) -> List[str]:
     return code
 
 
-def generate_function_stubs(sqls: Set[GenericSql]) -> List[str]:
+def generate_function_stubs(sqls: List[GenericSql]) -> List[str]:
     code = []
     # Generic function to visit any class by getattr'ing
     code.append('def visit(self, node: "GenericSql") -> T:')
@@ -87,18 +87,21 @@ def generate_visitor(
 
     registered_nodes = set()
 
-    for node in Sql._REGISTERED_NODES:
-        # TODO: Currently we don't support Lambda.Variable and other nested
-        # classes, should come up with a naming scheme for them in autogenerated
-        # visitor fn and expose them.
+    for node in Sql._REGISTERED_NODES.values():
+        # TODO: Currently we don't support nested classes, should come up with
+        # a naming scheme for them in autogenerated visitor fn and expose them.
         if node.__name__ != node.__qualname__:
             logging.warn(
                 f"Node {node.__qualname__} is currently excluded from visitor codegen."
             )
             continue
         registered_nodes.add(node)
+    # Sort the nodes so that regenerating the visitor gives the same file every time
+    sorted_nodes = sorted(
+        registered_nodes, key=lambda node: (node.__module__, node.__name__)
+    )
 
-    module_map = get_import_paths(registered_nodes)
+    module_map = get_import_paths(sorted_nodes)
     code.extend(["if TYPE_CHECKING:"])
     code.extend(
         [
@@ -110,7 +113,7 @@ def generate_visitor(
     code.extend(
         [
             textwrap.indent(fn_line, INDENT)
-            for fn_line in generate_function_stubs(registered_nodes)
+            for fn_line in generate_function_stubs(sorted_nodes)
         ]
     )
     with open(file_name, "w") as f:
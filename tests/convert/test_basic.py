@@ -22,6 +22,10 @@ class TestIdentifier(VisitorTest):
         assert isinstance(ast, SqlBaseParser.QuotedIdentifierContext)
         assert self.visitor.visit(ast) == "foo"
 
+        # Only the enclosing quotes are removed, escaped quotes are left intact
+        ast = get_parser('"""foo"""').identifier()
+        assert self.visitor.visit(ast) == '""foo""'
+
     def test_unquoted(self):
         ast = get_parser("foo").identifier()
         assert isinstance(ast, SqlBaseParser.UnquotedIdentifierContext)
@@ -92,6 +96,11 @@ class TestLiterals(VisitorTest):
             Literal("abc", data_type=varchar(max_chars=3))
         )
 
+        ast = get_parser("'''abc'''").primaryExpression()
+        self.visitor.visit(ast).assert_equals(
+            Literal("''abc''", data_type=varchar(max_chars=7))
+        )
+
         ast = get_parser("U&'chilly snowman \\2603'").primaryExpression()
         assert isinstance(ast, SqlBaseParser.StringLiteralContext)
         self.visitor.visit(ast).assert_equals(
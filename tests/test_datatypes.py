@@ -1,11 +1,17 @@
+import copy
+import pickle
 import unittest
+from decimal import Decimal
 
+import attr
 import pytest
 
+from treeno.builder.convert import type_from_sql
 from treeno.datatypes.builder import (
     array,
     bigint,
     boolean,
+    char,
     date,
     decimal,
     double,
@@ -29,6 +35,10 @@ from treeno.datatypes.builder import (
     varbinary,
     varchar,
 )
+from treeno.datatypes.conversions import common_supertype, get_arithmetic_type
+from treeno.datatypes.inference import infer_char, infer_type, infer_types
+from treeno.datatypes.types import VARCHAR
+from treeno.expression import Field
 
 
 class TestNonparametricTypes(unittest.TestCase):
@@ -158,5 +168,145 @@ class TestNonparametricTypes(unittest.TestCase):
             row(dtypes=[boolean(), 3])
 
 
+class TestBuilderCaching(unittest.TestCase):
+    def test_shared_instances(self):
+        assert boolean() is boolean()
+        assert unknown() is unknown()
+        assert decimal(precision=10, scale=0) is decimal(precision=10, scale=0)
+        assert varchar(max_chars=3) is not varchar(max_chars=4)
+        # Parameters of different python types don't share cache entries, so validation still runs
+        assert timestamp(timezone=True) is timestamp(timezone=True)
+        with pytest.raises(AssertionError, match="must be of type bool"):
+            timestamp(timezone=1)
+
+    def test_frozen(self):
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            bigint().type_name = VARCHAR
+        with pytest.raises(TypeError):
+            varchar(max_chars=3).parameters["max_chars"] = 50
+        assert str(varchar(max_chars=3)) == "VARCHAR(3)"
+        # The caller's parameters are copied rather than filled in place
+        parameters = {"scale": 2}
+        assert decimal(**parameters).parameters["precision"] == 38
+        assert parameters == {"scale": 2}
+        assert copy.deepcopy(varchar(max_chars=3)) is varchar(max_chars=3)
+
+    def test_pickle(self):
+        dtype = decimal(precision=10, scale=2)
+        assert pickle.loads(pickle.dumps(dtype)) == dtype
+        assert pickle.loads(pickle.dumps(bigint())) is bigint()
+        field = Field("a", table="t", data_type=dtype)
+        pickle.loads(pickle.dumps(field)).assert_equals(field)
+
+    def test_parameter_order(self):
+        # Cached types keep the parameters in the order they were passed in
+        assert list(decimal(precision=10, scale=2).parameters) == [
+            "precision",
+            "scale",
+        ]
+        assert list(decimal(scale=2, precision=10).parameters) == [
+            "scale",
+            "precision",
+        ]
+        assert decimal(scale=2, precision=10) == decimal(precision=10, scale=2)
+
+    def test_parsed_types_are_shared(self):
+        assert type_from_sql("bigint") is bigint()
+
+    def test_unhashable_parameters(self):
+        dtype = row(dtypes=[integer(), boolean()])
+        assert dtype is not row(dtypes=[integer(), boolean()])
+        assert dtype == row(dtypes=[integer(), boolean()])
+        assert str(array(dtype=dtype)) == "ARRAY(ROW(INTEGER,BOOLEAN))"
+
+
+class TestSupertypes(unittest.TestCase):
+    def test_different_base_types(self):
+        assert common_supertype(integer(), bigint()) == bigint()
+        assert common_supertype(tinyint(), double()) == double()
+        assert common_supertype(smallint(), decimal(precision=3, scale=1)) == (
+            decimal(precision=6, scale=1)
+        )
+        assert common_supertype(bigint(), decimal(precision=2, scale=2)) == (
+            decimal(precision=21, scale=2)
+        )
+        assert common_supertype(varchar(max_chars=3), char(max_chars=5)) == (
+            char(max_chars=5)
+        )
+        assert common_supertype(
+            char(max_chars=5), varchar(max_chars=70000)
+        ) == (char(max_chars=65536))
+        # An unbounded VARCHAR is promoted to CHAR's default length of 1
+        assert common_supertype(varchar(), char(max_chars=5)) == char(
+            max_chars=5
+        )
+        assert common_supertype(char(max_chars=5), varchar()) == char(
+            max_chars=5
+        )
+        assert common_supertype(p4hll(), hll()) == hll()
+        assert common_supertype(date(), timestamp()) == timestamp()
+        with pytest.raises(TypeError, match="No common supertypes"):
+            common_supertype(boolean(), integer())
+
+    def test_decimal(self):
+        assert get_arithmetic_type(
+            decimal(precision=5, scale=1), decimal(precision=4, scale=3)
+        ) == decimal(precision=7, scale=3)
+        assert get_arithmetic_type(
+            decimal(precision=3, scale=3), decimal(precision=10, scale=0)
+        ) == decimal(precision=13, scale=3)
+
+    def test_row(self):
+        dtype1 = row(dtypes=[integer(), integer(), varchar(max_chars=2)])
+        dtype2 = row(dtypes=[bigint(), bigint(), char(max_chars=3)])
+        assert get_arithmetic_type(dtype1, dtype2) == row(
+            dtypes=[bigint(), bigint(), char(max_chars=3)]
+        )
+
+
+class TestInference(unittest.TestCase):
+    def test_infer_types(self):
+        class Flag(int):
+            pass
+
+        assert infer_types(
+            [True, 1, 2**40, 1.5, Decimal("1.25"), "abc", Flag(3)]
+        ) == [
+            boolean(),
+            integer(),
+            bigint(),
+            double(),
+            decimal(precision=3, scale=2),
+            varchar(max_chars=3),
+            integer(),
+        ]
+        assert infer_types(
+            [-(2**31), 2**31 - 1, -(2**31) - 1, 2**31]
+        ) == [
+            integer(),
+            integer(),
+            bigint(),
+            bigint(),
+        ]
+        # Neither the sign nor leading zeros count towards the precision
+        assert infer_types(
+            [Decimal("-123.45"), Decimal("0.05"), Decimal("1E+3")]
+        ) == [
+            decimal(precision=5, scale=2),
+            decimal(precision=2, scale=2),
+            decimal(precision=4, scale=0),
+        ]
+        with pytest.raises(ValueError, match="Can't infer a decimal type"):
+            infer_types([Decimal("NaN")])
+
+    def test_inferred_strings_are_shared(self):
+        assert infer_type("abc") is infer_type("xyz")
+        assert infer_type("abc") == varchar(max_chars=3)
+        assert infer_char("ab") is infer_char("cd")
+        assert infer_char("ab") == char(max_chars=2)
+        with pytest.raises(NotImplementedError, match="can't be inferred"):
+            infer_types([object()])
+
+
 if __name__ == "__main__":
     unittest.main()
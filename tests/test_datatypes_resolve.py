@@ -1,10 +1,11 @@
 import unittest
 
 import attr
+import pytest
 
-from treeno.datatypes.builder import bigint, unknown
+from treeno.datatypes.builder import bigint, row, unknown, varchar
 from treeno.datatypes.resolve import resolve_fields
-from treeno.expression import Field, wrap_literal
+from treeno.expression import Field, Star, wrap_literal
 from treeno.functions.common import Concatenate
 from treeno.relation import Schema, SchemaField, Table
 
@@ -12,9 +13,11 @@ from treeno.relation import Schema, SchemaField, Table
 class TestConvertFields(unittest.TestCase):
     def test_convert(self):
         f1 = Field("x", table=None)
-        f2 = Field("y", table="a")
-        f3 = Field("z", table="b")
+        f2 = Field("y", table="b")
+        f3 = Field("z", table="c")
         f4 = Field("w", table="c")
+        # y exists in the schema, but not in table a
+        f5 = Field("y", table="a")
         schema = Schema(
             fields=[
                 SchemaField("x", Table(name="a"), bigint()),
@@ -24,21 +27,110 @@ class TestConvertFields(unittest.TestCase):
             relation_ids={"a", "b", "c"},
         )
         expr = (
-            Concatenate([wrap_literal(3) + f1, wrap_literal(2) - f2]) + f3 / f4
+            Concatenate([wrap_literal(3) + f1, wrap_literal(2) - f2])
+            + f3 / f4
+            + f5
         )
 
         assert f1.data_type == unknown()
         assert f2.data_type == unknown()
         assert f3.data_type == unknown()
         assert f4.data_type == unknown()
+        assert f5.data_type == unknown()
 
         new_expr = resolve_fields(expr, schema)
         new_f1 = attr.evolve(f1, data_type=bigint())
         new_f2 = attr.evolve(f2, data_type=bigint())
         new_f3 = attr.evolve(f3, data_type=bigint())
-        # f4 was not modified
-        assert (
-            new_expr
-            == Concatenate([wrap_literal(3) + new_f1, wrap_literal(2) - new_f2])
+        # f4 and f5 were not modified
+        new_expr.assert_equals(
+            Concatenate([wrap_literal(3) + new_f1, wrap_literal(2) - new_f2])
             + new_f3 / f4
+            + f5
+        )
+
+    def test_leaves_are_shared(self):
+        dtype = bigint()
+        schema = Schema(
+            fields=[SchemaField("x", Table(name="a"), dtype)],
+            relation_ids={"a"},
+        )
+        literal = wrap_literal("abc")
+        new_expr = resolve_fields(literal + Field("x"), schema)
+        # Data types and immutable leaves aren't copied into the resolved tree
+        assert new_expr.right.data_type is dtype
+        assert new_expr.left.value is literal.value
+        assert new_expr.left.data_type is literal.data_type
+
+    def test_unchanged_subtrees_are_shared(self):
+        schema = Schema(
+            fields=[SchemaField("x", Table(name="a"), bigint())],
+            relation_ids={"a"},
+        )
+        constant = wrap_literal(1) + 2
+        new_expr = resolve_fields(constant * Field("x"), schema)
+        # Subtrees without any fields are returned as is rather than copied
+        assert new_expr.left is constant
+        assert resolve_fields(constant, schema) is constant
+
+    def test_ambiguous_field(self):
+        schema = Schema(
+            fields=[
+                SchemaField("x", Table(name="a"), bigint()),
+                SchemaField("x", Table(name="b"), bigint()),
+                SchemaField("y", Table(name="b"), unknown()),
+            ],
+            relation_ids={"a", "b"},
+        )
+        with pytest.raises(AssertionError, match="Expected 1 global field"):
+            resolve_fields(Field("x"), schema)
+        assert resolve_fields(Field("y"), schema).data_type == unknown()
+        # Fields that aren't in the schema have nothing to resolve
+        missing = Field("z")
+        assert resolve_fields(missing, schema) is missing
+
+    def test_deep_expression(self):
+        schema = Schema(
+            fields=[SchemaField("x", Table(name="a"), bigint())],
+            relation_ids={"a"},
+        )
+        expr = Field("x")
+        # Deeper than the default recursion limit
+        for _ in range(2000):
+            expr = expr + 1
+        new_expr = resolve_fields(expr, schema)
+        assert new_expr.data_type == bigint()
+        while not isinstance(new_expr, Field):
+            new_expr = new_expr.left
+        assert new_expr.data_type == bigint()
+
+    def test_shared_nodes(self):
+        schema = Schema(
+            fields=[SchemaField("x", Table(name="a"), bigint())],
+            relation_ids={"a"},
+        )
+        shared = Field("x") + 1
+        new_expr = resolve_fields(shared * shared, schema)
+        # Shared subtrees are resolved once and stay shared
+        assert new_expr.left is new_expr.right
+        assert new_expr.left is not shared
+        assert new_expr.left.left.data_type == bigint()
+
+    def test_star(self):
+        schema = Schema(
+            fields=[
+                SchemaField("x", Table(name="a"), bigint()),
+                SchemaField("y", Table(name="b"), varchar()),
+                SchemaField("z", Table(name="b"), bigint()),
+            ],
+            relation_ids={"a", "b"},
+        )
+        assert resolve_fields(Star(), schema).data_type == row(
+            dtypes=[bigint(), varchar(), bigint()]
+        )
+        assert resolve_fields(Star(table="b"), schema).data_type == row(
+            dtypes=[varchar(), bigint()]
+        )
+        assert resolve_fields(Star(table="c"), schema).data_type == row(
+            dtypes=[]
         )
@@ -1,26 +1,77 @@
+import functools
 import unittest
 from decimal import Decimal
 
+import pytest
+
+from treeno.base import PrintMode, PrintOptions
 from treeno.datatypes.builder import (
+    boolean,
     decimal,
     double,
     integer,
     interval,
     smallint,
     unknown,
+    varchar,
 )
 from treeno.expression import (
     Add,
+    And,
     Divide,
+    Field,
+    Lambda,
     Literal,
     Minus,
     Multiply,
+    Or,
     TypeConstructor,
     wrap_literal,
+    wrap_literal_list,
+    wrap_literal_tuple,
 )
 
 
 class ExpressionTests(unittest.TestCase):
+    def test_wrap_literal(self):
+        # Literals are mutable, so every call builds a new one
+        literal = wrap_literal(1)
+        assert literal is not wrap_literal(1)
+        expr = Field("x") == 1
+        literal.value = 99
+        assert expr.sql(PrintOptions()) == '"x" = 1'
+        # Equal values of different types get their own data types
+        assert wrap_literal(True).data_type == boolean()
+        assert wrap_literal(1).data_type == integer()
+        assert wrap_literal(1.0).data_type == double()
+        assert wrap_literal(Decimal("1.00")).data_type == decimal(
+            precision=3, scale=2
+        )
+        assert wrap_literal(Decimal("1.0")).data_type == decimal(
+            precision=2, scale=1
+        )
+        # Values are passed through as is, both the first time their type is seen and afterwards
+        for _ in range(2):
+            field = Field("a")
+            assert wrap_literal(field) is field
+
+    def test_wrap_literal_tuple(self):
+        field = Field("a")
+        wrapped = wrap_literal_tuple([field, 1, "abc", 1.5])
+        assert isinstance(wrapped, tuple)
+        assert wrapped[0] is field
+        wrapped[1].assert_equals(Literal(1, data_type=integer()))
+        wrapped[2].assert_equals(Literal("abc", data_type=varchar(max_chars=3)))
+        wrapped[3].assert_equals(Literal(1.5, data_type=double()))
+        assert wrap_literal_tuple([]) == ()
+
+    def test_wrap_literal_list(self):
+        with pytest.deprecated_call():
+            wrapped = wrap_literal_list([1, "abc"])
+        assert isinstance(wrapped, list)
+        wrapped[0].assert_equals(Literal(1, data_type=integer()))
+        wrapped[1].assert_equals(Literal("abc", data_type=varchar(max_chars=3)))
+
     def test_binary_type_conversions(self):
         s, i, f, d = (
             Literal(1, data_type=smallint()),
@@ -63,6 +114,30 @@ class ExpressionTests(unittest.TestCase):
         assert Minus(d, t).data_type == unknown()
         assert Minus(ts, t).data_type == unknown()
 
+    def test_lambda_from_generic_expr(self):
+        constant = wrap_literal(2) * 3
+        expr = Field("a") + Field("b") - constant
+        lambda_expr = Lambda.from_generic_expr([Lambda.Variable("a")], expr)
+        lambda_expr.expr.assert_equals(
+            Lambda.Variable("a") + Field("b") - constant
+        )
+        # Subtrees without any of the lambda's variables are shared rather than copied
+        assert lambda_expr.expr.right is constant
+        assert lambda_expr.expr.left.right is expr.left.right
+
+    def test_operator_chains(self):
+        opts = PrintOptions()
+        expr = Field("a") + Field("b") + 1 - 2 + (Field("c") + Field("d"))
+        assert expr.sql(opts) == '"a" + "b" + 1 - 2 + ("c" + "d")'
+        expr = Or(Field("a"), Field("b")) | Field("c")
+        assert (
+            expr.sql(PrintOptions(mode=PrintMode.PRETTY))
+            == '"a"\nOR "b"\nOR "c"'
+        )
+        # Long chains don't recurse once per operand
+        expr = functools.reduce(And, [Field("a") == i for i in range(5000)])
+        assert expr.sql(opts).startswith('"a" = 0 AND "a" = 1 AND "a" = 2')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,7 +13,7 @@ In order to do this, this module introduces some preliminary classes for printin
 
 from abc import ABC, ABCMeta, abstractmethod
 from enum import Enum, EnumMeta, auto
-from typing import TYPE_CHECKING, Any, ClassVar, Set, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, TypeVar
 
 import attr
 
@@ -65,14 +65,18 @@ class Sql(ABC):
     One usecase is to autogenerate the function body of the visitor class
     """
 
-    # List contains all nodes that inherit from Sql.
-    _REGISTERED_NODES: ClassVar[Set[GenericSql]] = set()
+    # Empty so that slotted subclasses don't get a __dict__ anyway
+    __slots__ = ()
+
+    # All nodes that inherit from Sql, keyed by their module and qualified name.
+    _REGISTERED_NODES: ClassVar[Dict[Tuple[str, str], GenericSql]] = {}
 
     def __init_subclass__(cls, *args: Any, **kwargs: Any):
         super().__init_subclass__(*args, **kwargs)
         # Register all non-abstract classes
         if not is_abstract(cls):
-            cls._REGISTERED_NODES.add(cls)
+            # attrs replaces slotted classes with a new class of the same name, so only the latest one is kept
+            cls._REGISTERED_NODES[(cls.__module__, cls.__qualname__)] = cls
 
     # TODO: Reenable this
     @abstractmethod
@@ -1,8 +1,9 @@
 """
 Converts from our grammar into a buildable query tree.
 """
+import operator
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from overrides import overrides
 
@@ -14,10 +15,13 @@ from treeno.datatypes.builder import (
     interval,
     row,
     unknown,
-    varchar,
 )
-from treeno.datatypes.inference import infer_decimal, infer_integral
-from treeno.datatypes.types import FIELDS, TIME, TIMESTAMP, DataType
+from treeno.datatypes.inference import (
+    infer_decimal,
+    infer_integral,
+    infer_varchar,
+)
+from treeno.datatypes.types import FIELDS, TIME, TIMESTAMP, DataType, make_dtype
 from treeno.expression import (
     AliasedStar,
     AliasedValue,
@@ -89,7 +93,6 @@ from treeno.relation import (
     Unnest,
     ValuesQuery,
 )
-from treeno.util import nth
 from treeno.window import (
     BoundedFrameBound,
     BoundType,
@@ -113,50 +116,42 @@ def type_from_sql(sql: str) -> DataType:
     return ConvertVisitor().visitStandaloneType(AST(sql).type())
 
 
-def apply_operator(operator: str, *args: Value) -> Value:
-    if operator == "AND":
-        return args[0] & args[1]
-    elif operator == "OR":
-        return args[0] | args[1]
-    elif operator == "=":
-        return args[0] == args[1]
-    elif operator == ">":
-        return args[0] > args[1]
-    elif operator == ">=":
-        return args[0] >= args[1]
-    elif operator == "<":
-        return args[0] < args[1]
-    elif operator == "<=":
-        return args[0] <= args[1]
-    elif operator == "<>":
-        return args[0] != args[1]
-    elif operator == "+":
-        if len(args) == 1:
-            return +args[0]
-        else:
-            assert len(args) == 2
-            return args[0] + args[1]
-    elif operator == "-":
-        if len(args) == 1:
-            return -args[0]
-        else:
-            assert len(args) == 2
-            return args[0] - args[1]
-    elif operator == "*":
-        return args[0] * args[1]
-    elif operator == "/":
-        return args[0] / args[1]
-    elif operator == "%":
-        return args[0] % args[1]
-    else:
-        raise NotImplementedError(f"Unrecognized token {operator}")
+_UNARY_OPERATORS: Dict[str, Callable[[Value], Value]] = {
+    "+": operator.pos,
+    "-": operator.neg,
+}
+
+_BINARY_OPERATORS: Dict[str, Callable[[Value, Value], Value]] = {
+    "AND": operator.and_,
+    "OR": operator.or_,
+    "=": operator.eq,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "<>": operator.ne,
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+}
+
+
+def apply_operator(op_text: str, *args: Value) -> Value:
+    assert len(args) in (1, 2), f"Unexpected number of operands {len(args)}"
+    operators = _UNARY_OPERATORS if len(args) == 1 else _BINARY_OPERATORS
+    if op_text not in operators:
+        raise NotImplementedError(f"Unrecognized token {op_text}")
+    return operators[op_text](*args)
 
 
 def table_from_qualifiers(qualifiers: List[str]) -> Table:
-    qualifiers = list(reversed(qualifiers))
-    name: str = qualifiers[0]
-    schema: Optional[str] = nth(qualifiers, 1)
-    catalog: Optional[str] = nth(qualifiers, 2)
+    # Qualifiers are ordered as catalog.schema.name, where only the name is required
+    num_qualifiers = len(qualifiers)
+    name: str = qualifiers[-1]
+    schema: Optional[str] = qualifiers[-2] if num_qualifiers >= 2 else None
+    catalog: Optional[str] = qualifiers[-3] if num_qualifiers >= 3 else None
 
     return Table(name=name, schema=schema, catalog=catalog)
 
@@ -398,7 +393,7 @@ class ConvertVisitor(SqlBaseVisitor):
         expressions = ctx.expression()
         in_list = InList(
             value=ctx.left_value,
-            exprs=[self.visit(expr) for expr in expressions],
+            exprs=list(map(self.visit, expressions)),
         )
         if ctx.NOT():
             return ~in_list
@@ -493,18 +488,18 @@ class ConvertVisitor(SqlBaseVisitor):
     def visitGenericType(
         self, ctx: SqlBaseParser.GenericTypeContext
     ) -> DataType:
-        param_values = [self.visit(param) for param in ctx.typeParameter()]
+        param_values = list(map(self.visit, ctx.typeParameter()))
         type_name = self.visit(ctx.identifier()).upper()
         # We assume the parameters will be passed into here.
         parameters = {
             param.name: val
-            for val, param in zip(param_values, FIELDS[type_name])
+            for val, param in zip(param_values, FIELDS.get(type_name, ()))
         }
-        return DataType(type_name, parameters=parameters)
+        return make_dtype(type_name, parameters=parameters)
 
     @overrides
     def visitRowType(self, ctx: SqlBaseParser.RowTypeContext) -> DataType:
-        types = [self.visit(row) for row in ctx.rowField()]
+        types = list(map(self.visit, ctx.rowField()))
         return row(dtypes=types)
 
     @overrides
@@ -717,7 +712,7 @@ class ConvertVisitor(SqlBaseVisitor):
         self, ctx: SqlBaseParser.StringLiteralContext
     ) -> Literal:
         string = self.visit(ctx.string())
-        return Literal(string, data_type=varchar(max_chars=len(string)))
+        return Literal(string, data_type=infer_varchar(string))
 
     @overrides
     def visitDoubleLiteral(
@@ -732,7 +727,8 @@ class ConvertVisitor(SqlBaseVisitor):
     def visitBasicStringLiteral(
         self, ctx: SqlBaseParser.BasicStringLiteralContext
     ) -> str:
-        return ctx.getText().strip("'")
+        # The grammar guarantees the text is wrapped in single quotes
+        return ctx.getText()[1:-1]
 
     @overrides
     def visitUnicodeStringLiteral(
@@ -956,7 +952,8 @@ class ConvertVisitor(SqlBaseVisitor):
     def visitQuotedIdentifier(
         self, ctx: SqlBaseParser.QuotedIdentifierContext
     ) -> str:
-        return ctx.getText().strip('"')
+        # The grammar guarantees the text is wrapped in double quotes
+        return ctx.getText()[1:-1]
 
     @overrides
     def visitUnquotedIdentifier(
@@ -1045,9 +1042,7 @@ class ConvertVisitor(SqlBaseVisitor):
     ) -> JoinCriteria:
         if ctx.USING():
             return JoinUsingCriteria(
-                column_names=[
-                    self.visit(identifier) for identifier in ctx.identifier()
-                ]
+                column_names=list(map(self.visit, ctx.identifier()))
             )
         return JoinOnCriteria(constraint=self.visit(ctx.booleanExpression()))
 
@@ -1099,13 +1094,13 @@ class ConvertVisitor(SqlBaseVisitor):
     def visitColumnAliases(
         self, ctx: SqlBaseParser.ColumnAliasesContext
     ) -> List[str]:
-        return [self.visit(identifier) for identifier in ctx.identifier()]
+        return list(map(self.visit, ctx.identifier()))
 
     @overrides
     def visitQualifiedName(
         self, ctx: SqlBaseParser.QualifiedNameContext
     ) -> List[str]:
-        return [self.visit(identifier) for identifier in ctx.identifier()]
+        return list(map(self.visit, ctx.identifier()))
 
     @overrides
     def visitTableName(self, ctx: SqlBaseParser.TableNameContext) -> Table:
@@ -1271,9 +1266,7 @@ class ConvertVisitor(SqlBaseVisitor):
     ) -> SelectQuery:
         # Always returns a list of items to select from
         select_terms = ctx.selectItem()
-        query_builder = SelectQuery(
-            select=[self.visit(item) for item in select_terms]
-        )
+        query_builder = SelectQuery(select=list(map(self.visit, select_terms)))
 
         relations = ctx.relation()
         if relations:
@@ -1,9 +1,7 @@
 from enum import Enum
-from io import StringIO
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import typer
-from nltk.tree import Tree
 
 from treeno.base import DefaultableEnum, PrintMode, PrintOptions, Sql
 from treeno.builder.convert import (
@@ -16,10 +14,14 @@ from treeno.datatypes.types import DataType
 from treeno.grammar.parse import AST
 from treeno.grammar.parse import tree as print_tree
 from treeno.relation import Schema
-from treeno.util import children, is_dictlike, is_listlike
+from treeno.util import child_names, fold_tree, is_dictlike, is_listlike
 
 app = typer.Typer()
 
+# These are constant, so we style them once rather than for every field in a schema
+_NONE_STRING = typer.style("<none>", fg=typer.colors.RED, bold=True)
+_UNKNOWN_STRING = typer.style("<unknown>", fg=typer.colors.RED, bold=True)
+
 
 class SqlConstruct(str, Enum):
     QUERY = "query"
@@ -27,18 +29,28 @@ class SqlConstruct(str, Enum):
     TYPE = "type"
 
 
+_PARSERS: Dict[SqlConstruct, Callable[[str], Sql]] = {
+    SqlConstruct.QUERY: query_from_sql,
+    SqlConstruct.EXPRESSION: expression_from_sql,
+    SqlConstruct.TYPE: type_from_sql,
+}
+
+_AST_NODES: Dict[SqlConstruct, Callable[[AST], Any]] = {
+    SqlConstruct.QUERY: AST.query,
+    SqlConstruct.EXPRESSION: AST.expression,
+    SqlConstruct.TYPE: AST.type,
+}
+
+
 def get_sql_object(construct_type: SqlConstruct, sql: str) -> Sql:
-    sql_object: Sql
-    if construct_type == SqlConstruct.QUERY:
-        sql_object = query_from_sql(sql)
+    try:
+        parse = _PARSERS[construct_type]
+    except KeyError:
+        raise TypeError(f"Unexpected sql construct type {construct_type.value}")
+    sql_object = parse(sql)
+    if construct_type is SqlConstruct.QUERY:
         # Resolve a query since it is much more complicated
         sql_object.resolve(Schema.empty_schema())
-    elif construct_type == SqlConstruct.EXPRESSION:
-        sql_object = expression_from_sql(sql)
-    elif construct_type == SqlConstruct.TYPE:
-        sql_object = type_from_sql(sql)
-    else:
-        raise TypeError(f"Unexpected sql construct type {construct_type.value}")
     return sql_object
 
 
@@ -50,15 +62,12 @@ def format(construct_type: SqlConstruct, sql: str) -> None:
 
 @app.command()
 def antlr_tree(construct_type: SqlConstruct, sql: str) -> None:
-    ast = AST(sql)
-    if construct_type == SqlConstruct.QUERY:
-        node = ast.query()
-    elif construct_type == SqlConstruct.EXPRESSION:
-        node = ast.expression()
-    elif construct_type == SqlConstruct.TYPE:
-        node = ast.type()
-    else:
+    try:
+        get_node = _AST_NODES[construct_type]
+    except KeyError:
         raise TypeError(f"Unexpected sql construct type {construct_type.value}")
+    ast = AST(sql)
+    node = get_node(ast)
     typer.echo(print_tree(ast, node))
 
 
@@ -76,30 +85,46 @@ def _should_skip(key: str, node: Any) -> bool:
 
 
 def treeify(node: Any) -> Any:
-    if is_listlike(node):
-        return Tree(
-            f"<{type(node).__name__}>", [treeify(item) for item in node]
-        )
-    if is_dictlike(node):
+    # nltk is slow to import, so only pay for it in the commands that draw trees
+    from nltk.tree import Tree
+
+    def expand(current: Any) -> Optional[Tuple[List[Any], List[Any]]]:
+        if is_listlike(current):
+            return list(range(len(current))), list(current)
+        if is_dictlike(current):
+            return list(current.keys()), list(current.values())
+        # Data types are terminal and we don't want to print out the parameters when there is none
+        if not isinstance(current, Sql) or isinstance(current, DataType):
+            return None
+        keys = []
+        values = []
+        for name in child_names(type(current)):
+            value = getattr(current, name)
+            if not _should_skip(name, value):
+                keys.append(name)
+                values.append(value)
+        return keys, values
+
+    def combine(
+        current: Any, keys: List[Any], values: List[Any], child_trees: List[Any]
+    ) -> Any:
+        label = f"<{type(current).__name__}>"
+        if is_listlike(current):
+            return Tree(label, child_trees)
+        if is_dictlike(current):
+            return Tree(label, [Tree(k, v) for k, v in zip(keys, child_trees)])
         return Tree(
-            f"<{type(node).__name__}>",
-            [Tree(k, treeify(v)) for k, v in node.items()],
+            current.__class__.__name__,
+            [Tree(k, [v]) for k, v in zip(keys, child_trees)],
         )
-    if not isinstance(node, Sql):
-        return str(node)
-    # Data types are terminal and we don't want to print out the parameters when there is none
-    if isinstance(node, DataType):
-        return str(node)
-    child_nodes = [
-        Tree(k, [treeify(v)])
-        for k, v in children(node).items()
-        if not _should_skip(k, v)
-    ]
-    return Tree(node.__class__.__name__, child_nodes)
+
+    return fold_tree(node, expand, str, combine)
 
 
 @app.command()
 def tree(construct_type: SqlConstruct, sql: str, draw: bool = False) -> None:
+    from io import StringIO
+
     sql_obj = get_sql_object(construct_type, sql)
     tree = treeify(sql_obj)
     sio = StringIO()
@@ -119,17 +144,10 @@ def schema(sql: str) -> None:
             typer.style("Unknown schema", fg=typer.colors.RED, bold=True)
         )
         return
-    lines = []
-    for idx, field in enumerate(schema.fields):
-        field_string = (
-            typer.style("<none>", fg=typer.colors.RED, bold=True)
-            if field is None
-            else field.name
-        )
-        dtype_string = (
-            typer.style("<unknown>", fg=typer.colors.RED, bold=True)
-            if field.data_type == unknown()
-            else field.data_type
-        )
-        lines.append(f"{field_string} - {dtype_string}")
+    unknown_type = unknown()
+    lines = [
+        f"{_NONE_STRING if field.name is None else field.name} - "
+        f"{_UNKNOWN_STRING if field.data_type == unknown_type else field.data_type}"
+        for field in schema.fields
+    ]
     typer.echo("\n".join(lines))
@@ -6,110 +6,156 @@ circular dependencies.
 Note that we explicitly disallow arguments for types that can't be parametrized. We also strictly only allow keyword
 only arguments.
 
+Data types are treated as immutable once constructed, so the builders hand out shared instances: nonparametric types
+are module level singletons, and parametrized types are cached by their parameters whenever those are hashable.
+
 TODO: We should replace the kwargs with actual argument names
 """
+import functools
+from typing import Any, Dict, Tuple
+
 from treeno.datatypes import types
 
+_BOOLEAN = types.make_dtype(types.BOOLEAN)
+_TINYINT = types.make_dtype(types.TINYINT)
+_SMALLINT = types.make_dtype(types.SMALLINT)
+_INTEGER = types.make_dtype(types.INTEGER)
+_BIGINT = types.make_dtype(types.BIGINT)
+_REAL = types.make_dtype(types.REAL)
+_DOUBLE = types.make_dtype(types.DOUBLE)
+_VARBINARY = types.make_dtype(types.VARBINARY)
+_JSON = types.make_dtype(types.JSON)
+_DATE = types.make_dtype(types.DATE)
+_UNKNOWN = types.make_dtype(types.UNKNOWN)
+_IP = types.make_dtype(types.IP)
+_UUID = types.make_dtype(types.UUID)
+_HLL = types.make_dtype(types.HLL)
+_P4HLL = types.make_dtype(types.P4HLL)
+_TDIGEST = types.make_dtype(types.TDIGEST)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_parametrized(
+    type_name: str, parameters: Tuple[Tuple[str, type, Any], ...]
+) -> types.DataType:
+    return types.DataType(
+        type_name, parameters={name: value for name, _, value in parameters}
+    )
+
+
+def _parametrized(type_name: str, parameters: Dict[str, Any]) -> types.DataType:
+    # The value's type is part of the key so that i.e. precision=1 and precision=True don't share a cache entry. The key
+    # keeps the keyword order so the cached type's parameters come out in the order they were passed in.
+    key = tuple(
+        (name, type(value), value) for name, value in parameters.items()
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # Parameters such as nested data types or lists of them aren't hashable
+        return types.DataType(type_name, parameters=parameters)
+    return _cached_parametrized(type_name, key)
+
 
 def boolean() -> types.DataType:
-    return types.DataType(types.BOOLEAN)
+    return _BOOLEAN
 
 
 def tinyint() -> types.DataType:
-    return types.DataType(types.TINYINT)
+    return _TINYINT
 
 
 def smallint() -> types.DataType:
-    return types.DataType(types.SMALLINT)
+    return _SMALLINT
 
 
 def integer() -> types.DataType:
-    return types.DataType(types.INTEGER)
+    return _INTEGER
 
 
 def bigint() -> types.DataType:
-    return types.DataType(types.BIGINT)
+    return _BIGINT
 
 
 def real() -> types.DataType:
-    return types.DataType(types.REAL)
+    return _REAL
 
 
 def double() -> types.DataType:
-    return types.DataType(types.DOUBLE)
+    return _DOUBLE
 
 
 def decimal(**kwargs) -> types.DataType:
-    return types.DataType(types.DECIMAL, parameters=kwargs)
+    return _parametrized(types.DECIMAL, kwargs)
 
 
 def varchar(**kwargs) -> types.DataType:
-    return types.DataType(types.VARCHAR, parameters=kwargs)
+    return _parametrized(types.VARCHAR, kwargs)
 
 
 def char(**kwargs) -> types.DataType:
-    return types.DataType(types.CHAR, parameters=kwargs)
+    return _parametrized(types.CHAR, kwargs)
 
 
 def varbinary() -> types.DataType:
-    return types.DataType(types.VARBINARY)
+    return _VARBINARY
 
 
 def json() -> types.DataType:
-    return types.DataType(types.JSON)
+    return _JSON
 
 
 def date() -> types.DataType:
-    return types.DataType(types.DATE)
+    return _DATE
 
 
 def time(**kwargs) -> types.DataType:
-    return types.DataType(types.TIME, parameters=kwargs)
+    return _parametrized(types.TIME, kwargs)
 
 
 def timestamp(**kwargs) -> types.DataType:
-    return types.DataType(types.TIMESTAMP, parameters=kwargs)
+    return _parametrized(types.TIMESTAMP, kwargs)
 
 
 def interval(**kwargs) -> types.DataType:
-    return types.DataType(types.INTERVAL, parameters=kwargs)
+    return _parametrized(types.INTERVAL, kwargs)
 
 
 def array(**kwargs) -> types.DataType:
-    return types.DataType(types.ARRAY, parameters=kwargs)
+    return _parametrized(types.ARRAY, kwargs)
 
 
 def map_(**kwargs) -> types.DataType:
-    return types.DataType(types.MAP, parameters=kwargs)
+    return _parametrized(types.MAP, kwargs)
 
 
 def row(**kwargs) -> types.DataType:
-    return types.DataType(types.ROW, parameters=kwargs)
+    return _parametrized(types.ROW, kwargs)
 
 
 def unknown() -> types.DataType:
-    return types.DataType(types.UNKNOWN)
+    return _UNKNOWN
 
 
 def ip() -> types.DataType:
-    return types.DataType(types.IP)
+    return _IP
 
 
 def uuid() -> types.DataType:
-    return types.DataType(types.UUID)
+    return _UUID
 
 
 def hll() -> types.DataType:
-    return types.DataType(types.HLL)
+    return _HLL
 
 
 def p4hll() -> types.DataType:
-    return types.DataType(types.P4HLL)
+    return _P4HLL
 
 
 def qdigest(**kwargs) -> types.DataType:
-    return types.DataType(types.QDIGEST, parameters=kwargs)
+    return _parametrized(types.QDIGEST, kwargs)
 
 
 def tdigest() -> types.DataType:
-    return types.DataType(types.TDIGEST)
+    return _TDIGEST
@@ -10,6 +10,8 @@ Note that this module is very much in flux, as I operate under an assumption:
 The supertype of the input types under typical binary operators will be the output type (with exceptions, such as
 timestamp - timestamp = interval)
 """
+from typing import Dict, Tuple
+
 from treeno.datatypes.builder import (
     array,
     char,
@@ -46,6 +48,11 @@ from treeno.datatypes.types import (
 
 INTEGRAL_TYPES = {INTEGER, BIGINT, SMALLINT, TINYINT}
 INTEGRAL_DECIMAL_PRECISION = {TINYINT: 3, SMALLINT: 5, INTEGER: 10, BIGINT: 19}
+# Data types are immutable, so the decimal each integral type gets promoted to can be built once up front
+INTEGRAL_DECIMAL_TYPES = {
+    type_name: decimal(precision=precision, scale=0)
+    for type_name, precision in INTEGRAL_DECIMAL_PRECISION.items()
+}
 FLOAT_TYPES = {REAL, DOUBLE}
 # Decimal can be either a float or an integral, and we treat it fairly differently so it's a special case
 NUMERIC_TYPES = INTEGRAL_TYPES | FLOAT_TYPES | {DECIMAL}
@@ -60,34 +67,35 @@ DATETIME_TYPES = {DATE, TIME, TIMESTAMP}
 
 
 def get_arithmetic_type(dtype1: DataType, dtype2: DataType) -> DataType:
-    if dtype1 == dtype2:
+    # The builders share data type instances, so checking identity first usually skips the attrs generated __eq__
+    if dtype1 is dtype2:
         return dtype1
     name1, name2 = dtype1.type_name, dtype2.type_name
     if name1 == name2:
+        # Types with different names can't be equal, so only these need the full comparison
+        if dtype1 == dtype2:
+            return dtype1
         return common_same_type(dtype1, dtype2)
-    elif {name1, name2}.issubset(NUMERIC_TYPES):
+    elif name1 in NUMERIC_TYPES and name2 in NUMERIC_TYPES:
         return common_numeric(dtype1, dtype2)
     return unknown()
 
 
 def common_supertype(dtype1: DataType, dtype2: DataType) -> DataType:
-    """Returns a common supertype for the given dtypes.
-    """
+    """Returns a common supertype for the given dtypes."""
+    if dtype1 is dtype2:
+        return dtype1
     if dtype1.type_name == dtype2.type_name:
         if dtype1 == dtype2:
             return dtype1
         if dtype1.type_name in COMMON_CONVERSION_MAP:
             common_same_type(dtype1, dtype2)
         return unknown()
-    elif dtype1.type_name in NUMERIC_TYPES:
-        return common_numeric(dtype1, dtype2)
-    elif dtype1.type_name in STRING_TYPES:
-        return common_string(dtype1, dtype2)
-    elif dtype1.type_name in HLL_TYPES:
-        return common_hll(dtype1, dtype2)
-    elif dtype1.type_name in DATETIME_TYPES:
-        return common_datetime(dtype1, dtype2)
-    raise TypeError(f"No common supertypes between {dtype1} and {dtype2}")
+    try:
+        find_supertype = SUPERTYPE_DISPATCH[dtype1.type_name]
+    except KeyError:
+        raise TypeError(f"No common supertypes between {dtype1} and {dtype2}")
+    return find_supertype(dtype1, dtype2)
 
 
 def common_same_type(dtype1: DataType, dtype2: DataType) -> DataType:
@@ -103,7 +111,7 @@ def common_datetime(dtype1: DataType, dtype2: DataType) -> DataType:
     assert (
         dtype1.type_name in DATETIME_TYPES
         and dtype2.type_name in DATETIME_TYPES
-    ), f"common_numeric must be called with types in {DATETIME_TYPES}"
+    ), f"common_datetime must be called with types in {DATETIME_TYPES}"
     # date and time are not convertible to each other
     if {dtype1.type_name, dtype2.type_name} == {DATE, TIME}:
         return unknown()
@@ -115,7 +123,7 @@ def common_hll(dtype1: DataType, dtype2: DataType) -> DataType:
     # NOTE: It is assumed here that these dtypes don't have the same base type
     assert (
         dtype1.type_name in HLL_TYPES and dtype2.type_name in HLL_TYPES
-    ), f"common_numeric must be called with types in {HLL_TYPES}"
+    ), f"common_hll must be called with types in {HLL_TYPES}"
     # No matter what we cast to hll
     return hll()
 
@@ -124,56 +132,45 @@ def common_string(dtype1: DataType, dtype2: DataType) -> DataType:
     # NOTE: It is assumed here that these dtypes don't have the same base type
     assert (
         dtype1.type_name in STRING_TYPES and dtype2.type_name in STRING_TYPES
-    ), f"common_numeric must be called with types in {STRING_TYPES}"
+    ), f"common_string must be called with types in {STRING_TYPES}"
     # Refer to https://github.com/trinodb/trino/blob/5450e782ca4b764f17465c1a40b914ad6743bd6c/core/trino-main/src/main/java/io/trino/type/TypeCoercion.java#L501
     # for why CHAR can't be convertible to VARCHAR.
-    has_char = CHAR in {dtype1.type_name, dtype2.type_name}
-    if has_char:
-        dtype1 = (
-            promote_varchar_to_char(dtype1)
-            if dtype1.type_name != CHAR
-            else dtype1
-        )
-        dtype2 = (
-            promote_varchar_to_char(dtype2)
-            if dtype2.type_name != CHAR
-            else dtype2
-        )
-        return COMMON_CONVERSION_MAP[CHAR](dtype1, dtype2)
-    else:
+    if CHAR not in (dtype1.type_name, dtype2.type_name):
         return COMMON_CONVERSION_MAP[VARCHAR](dtype1, dtype2)
+    if dtype1.type_name != CHAR:
+        dtype1 = promote_varchar_to_char(dtype1)
+    if dtype2.type_name != CHAR:
+        dtype2 = promote_varchar_to_char(dtype2)
+    return COMMON_CONVERSION_MAP[CHAR](dtype1, dtype2)
 
 
 def common_numeric(dtype1: DataType, dtype2: DataType) -> DataType:
     # NOTE: It is assumed here that these dtypes don't have the same base type
+    name1, name2 = dtype1.type_name, dtype2.type_name
     assert (
-        dtype1.type_name in NUMERIC_TYPES and dtype2.type_name in NUMERIC_TYPES
+        name1 in NUMERIC_TYPES and name2 in NUMERIC_TYPES
     ), f"common_numeric must be called with types in {NUMERIC_TYPES}"
-    if dtype1.type_name in INTEGRAL_TYPES:
-        if dtype2.type_name in INTEGRAL_TYPES:
+    # The helpers below don't check the type names again, since anything that's neither integral nor a float is a
+    # decimal.
+    if name1 in INTEGRAL_TYPES:
+        if name2 in INTEGRAL_TYPES:
             return common_integral(dtype1, dtype2)
-        if dtype2.type_name in FLOAT_TYPES:
+        if name2 in FLOAT_TYPES:
             return dtype2
-        assert (
-            dtype2.type_name == DECIMAL
-        ), f"Expected a decimal type for {dtype2}"
         return COMMON_CONVERSION_MAP[DECIMAL](
             promote_integral_to_decimal(dtype1), dtype2
         )
-    elif dtype1.type_name in FLOAT_TYPES:
-        if dtype2.type_name in FLOAT_TYPES:
+    elif name1 in FLOAT_TYPES:
+        if name2 in FLOAT_TYPES:
             return common_float(dtype1, dtype2)
         # Floats have the highest priority
         return dtype1
     else:
-        assert (
-            dtype1.type_name == DECIMAL
-        ), f"Expected a decimal type for {dtype2}"
-        if dtype2.type_name in INTEGRAL_TYPES:
+        if name2 in INTEGRAL_TYPES:
             return COMMON_CONVERSION_MAP[DECIMAL](
                 dtype1, promote_integral_to_decimal(dtype2)
             )
-        if dtype2.type_name in FLOAT_TYPES:
+        if name2 in FLOAT_TYPES:
             return dtype2
     raise TypeError(
         f"Unexpected type conversion {dtype1} and {dtype2} unregistered in {NUMERIC_TYPES}"
@@ -189,17 +186,12 @@ def promote_varchar_to_char(varchar_dtype: DataType) -> DataType:
 
 
 def promote_integral_to_decimal(dtype: DataType) -> DataType:
-    return decimal(
-        precision=INTEGRAL_DECIMAL_PRECISION[dtype.type_name], scale=0
-    )
+    return INTEGRAL_DECIMAL_TYPES[dtype.type_name]
 
 
 def common_integral(dtype1: DataType, dtype2: DataType) -> DataType:
-    # NOTE: It is assumed here that these dtypes don't have the same base type
-    assert (
-        dtype1.type_name in INTEGRAL_TYPES
-        and dtype2.type_name in INTEGRAL_TYPES
-    ), f"common_integral must be called with types in {INTEGRAL_TYPES}"
+    # NOTE: It is assumed here that these dtypes don't have the same base type, and that common_numeric already checked
+    # that they're both integral
     # Since we're gonna use the precision map, we might as well use it here for priority
     p1, p2 = (
         INTEGRAL_DECIMAL_PRECISION[dtype1.type_name],
@@ -209,9 +201,7 @@ def common_integral(dtype1: DataType, dtype2: DataType) -> DataType:
 
 
 def common_float(dtype1: DataType, dtype2: DataType) -> DataType:
-    assert (
-        dtype1.type_name in FLOAT_TYPES and dtype2.type_name in FLOAT_TYPES
-    ), f"common_float must be called with types in {FLOAT_TYPES}"
+    # NOTE: It is assumed here that common_numeric already checked that these dtypes are both floats
     # TODO: So far we only have DOUBLE and FLOAT, so this is a very simple branch
     return dtype1 if dtype1.type_name == DOUBLE else dtype2
 
@@ -222,8 +212,15 @@ def common_decimal(dtype1: DataType, dtype2: DataType) -> DataType:
     ), "common_decimal must be called with DECIMAL type only"
     s1, s2 = dtype1.parameters["scale"], dtype2.parameters["scale"]
     p1, p2 = dtype1.parameters["precision"], dtype2.parameters["precision"]
-    scale = max([s1, s2])
-    return decimal(precision=max([p1 - s1, p2 - s2]) + scale, scale=scale)
+    # The result needs enough digits on both sides of the decimal point for either operand
+    integer_digits1, integer_digits2 = p1 - s1, p2 - s2
+    integer_digits = (
+        integer_digits1
+        if integer_digits1 > integer_digits2
+        else integer_digits2
+    )
+    scale = s1 if s1 > s2 else s2
+    return decimal(precision=integer_digits + scale, scale=scale)
 
 
 def common_varchar(dtype1: DataType, dtype2: DataType) -> DataType:
@@ -256,9 +253,14 @@ def common_row(dtype1: DataType, dtype2: DataType) -> DataType:
     assert (
         dtype1.type_name == dtype2.type_name == ROW
     ), "common_row must be called with ROW type only"
+    # The builders share data type instances, so wide rows tend to repeat the same pairs of field types
+    supertypes: Dict[Tuple[int, int], DataType] = {}
     dtypes = []
     for t1, t2 in zip(dtype1.parameters["dtypes"], dtype2.parameters["dtypes"]):
-        dtypes.append(common_supertype(t1, t2))
+        key = (id(t1), id(t2))
+        if key not in supertypes:
+            supertypes[key] = common_supertype(t1, t2)
+        dtypes.append(supertypes[key])
     return row(dtypes=dtypes)
 
 
@@ -284,7 +286,7 @@ def common_array(dtype1: DataType, dtype2: DataType) -> DataType:
 def common_timestamp(dtype1: DataType, dtype2: DataType) -> DataType:
     assert (
         dtype1.type_name == dtype2.type_name == TIMESTAMP
-    ), "common_timestamp must be called with TIMESTAMPtype only"
+    ), "common_timestamp must be called with TIMESTAMP type only"
     timezoned = dtype1.parameters["timezone"] or dtype2.parameters["timezone"]
     precision = max(
         dtype1.parameters["precision"], dtype2.parameters["precision"]
@@ -327,3 +329,11 @@ COMMON_CONVERSION_MAP = {
     TIMESTAMP: common_timestamp,
     INTERVAL: common_interval,
 }
+
+# Finds the common supertype of two dtypes with different base types, keyed by the first dtype's type name
+SUPERTYPE_DISPATCH = {
+    **{type_name: common_numeric for type_name in NUMERIC_TYPES},
+    **{type_name: common_string for type_name in STRING_TYPES},
+    **{type_name: common_hll for type_name in HLL_TYPES},
+    **{type_name: common_datetime for type_name in DATETIME_TYPES},
+}
@@ -2,8 +2,9 @@
 
 Should not be used in datatypes.types to prevent circular imports
 """
+import functools
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Dict, Iterable, List
 
 from treeno.datatypes.builder import (
     bigint,
@@ -16,51 +17,71 @@ from treeno.datatypes.builder import (
 )
 from treeno.datatypes.types import DataType
 
+# Range of trino's INTEGER type, anything outside of it is a BIGINT
+INT32_MIN = -(1 << 31)
+INT32_MAX = (1 << 31) - 1
+
 
 def infer_type(value: Any) -> DataType:
-    """Infers a trino type from the given python value.
-    """
-    if isinstance(value, bool):
-        return boolean()
-    if isinstance(value, int):
-        return infer_integral(value)
-    if isinstance(value, float):
-        return double()
-    if isinstance(value, Decimal):
-        # NOTE: This is best-effort inference, since the precision of
-        # a decimal is encoded in its string value
-        return infer_decimal(value)
-    if isinstance(value, str):
-        # NOTE: We opt for varchar type with no length limit here because the max char limit can be any
-        # integer greater than len(value)
-        return varchar(max_chars=len(value))
-    raise NotImplementedError(
-        f"Value {value} with type {type(value).__name__} can't be inferred"
-    )
+    """Infers a trino type from the given python value."""
+    # Most values are exactly one of the builtin types, so we look up their type directly before trying subclasses
+    infer = TYPE_INFERENCE_MAP.get(type(value))
+    if infer is None:
+        # NOTE: bool is a subclass of int, so the order of the map matters here
+        for python_type, infer_subtype in TYPE_INFERENCE_MAP.items():
+            if isinstance(value, python_type):
+                infer = infer_subtype
+                break
+        else:
+            raise NotImplementedError(
+                f"Value {value} with type {type(value).__name__} can't be inferred"
+            )
+    return infer(value)
+
+
+def infer_types(values: Iterable[Any]) -> List[DataType]:
+    """Infers trino types for each of the given python values."""
+    return [infer_type(value) for value in values]
+
+
+def infer_varchar(value: str) -> DataType:
+    # NOTE: We opt for varchar type with no length limit here because the max char limit can be any
+    # integer greater than len(value)
+    return _varchar_of_length(len(value))
 
 
 def infer_char(value: str) -> DataType:
-    return char(max_chars=len(value))
+    return _char_of_length(len(value))
+
+
+# Every string literal infers a length-parametrized type, so we cache them by length directly rather than going
+# through the builders' keyword argument cache on each call. Data types are immutable, so sharing them is safe.
+@functools.lru_cache(maxsize=512)
+def _varchar_of_length(length: int) -> DataType:
+    return varchar(max_chars=length)
+
+
+@functools.lru_cache(maxsize=512)
+def _char_of_length(length: int) -> DataType:
+    return char(max_chars=length)
 
 
 def infer_integral(value: int) -> DataType:
-    return integer() if -(0x7FFFFFFF + 1) <= value <= 0x7FFFFFFF else bigint()
+    return integer() if INT32_MIN <= value <= INT32_MAX else bigint()
 
 
 def infer_decimal(decimal_value: Decimal) -> DataType:
-    """We must infer a decimal from str and not float because we'll never be sure what the
+    """We must infer a decimal from its digits and not from a float because we'll never be sure what the
     actual scale is due to floats being imprecise.
     """
-    str_val = str(decimal_value)
-    if "." not in str_val:
-        return decimal(precision=len(str_val), scale=0)
-    else:
-        assert str_val.count(".") == 1, f"Malformed decimal str_val {str_val}"
-        decimal_point_pos = str_val.index(".")
-        return decimal(
-            precision=len(str_val) - 1,
-            scale=len(str_val) - decimal_point_pos - 1,
-        )
+    _, digits, exponent = decimal_value.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f"Can't infer a decimal type for {decimal_value}")
+    # The digits never have leading zeros, so i.e. 0.05 has digits (5,) and an exponent of -2
+    if exponent >= 0:
+        return decimal(precision=len(digits) + exponent, scale=0)
+    scale = -exponent
+    return decimal(precision=max(len(digits), scale), scale=scale)
 
 
 def infer_timelike_precision(value: str) -> int:
@@ -70,3 +91,14 @@ def infer_timelike_precision(value: str) -> int:
         return 0
     # In case we have timezone
     return len(value.rsplit(".")[-1].split(" ")[0])
+
+
+TYPE_INFERENCE_MAP: Dict[type, Callable[[Any], DataType]] = {
+    bool: lambda value: boolean(),
+    int: infer_integral,
+    float: lambda value: double(),
+    # NOTE: This is best-effort inference, since the precision of
+    # a decimal is encoded in its string value
+    Decimal: infer_decimal,
+    str: infer_varchar,
+}
@@ -1,5 +1,8 @@
 import copy
-from typing import Any, Dict
+from collections import defaultdict
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
 
 import attr
 
@@ -7,78 +10,145 @@ from treeno.base import Sql
 from treeno.datatypes.builder import row
 from treeno.datatypes.types import DataType
 from treeno.expression import Field, Star
-from treeno.relation import Query, Schema
-from treeno.util import children, is_dictlike, is_listlike
+from treeno.relation import Query, Schema, SchemaField
+from treeno.util import children, fold_tree, is_dictlike, is_listlike
 
+IMMUTABLE_LEAF_TYPES = (str, int, float, Decimal, Enum, type(None))
+# Exact types of the leaves that resolve_fields returns without copying, data types included
+SHARED_LEAF_TYPES = frozenset(
+    (str, int, float, bool, Decimal, type(None), DataType)
+)
 
-def _make_field(field: Field, schema: Schema) -> Field:
+
+@attr.s
+class _SchemaIndex:
+    """Lookups into a schema's fields, built once per resolve_fields call so fields don't have to be found by scanning
+    the whole schema.
+    """
+
+    schema: Schema = attr.ib()
+    by_name: Dict[Optional[str], List[SchemaField]] = attr.ib()
+    by_table: Dict[Optional[str], List[SchemaField]] = attr.ib()
+    by_name_and_table: Dict[
+        Tuple[Optional[str], Optional[str]], List[SchemaField]
+    ] = attr.ib()
+
+    @classmethod
+    def from_schema(cls, schema: Schema) -> "_SchemaIndex":
+        by_name: Dict[Optional[str], List[SchemaField]] = defaultdict(list)
+        by_table: Dict[Optional[str], List[SchemaField]] = defaultdict(list)
+        by_name_and_table: Dict[
+            Tuple[Optional[str], Optional[str]], List[SchemaField]
+        ] = defaultdict(list)
+        for f in schema.fields:
+            # Each source's identifier is only computed once per field
+            table_id = f.source.identifier()
+            by_name[f.name].append(f)
+            by_table[table_id].append(f)
+            by_name_and_table[(f.name, table_id)].append(f)
+        return cls(schema, by_name, by_table, by_name_and_table)
+
+
+def _make_field(field: Field, index: _SchemaIndex) -> Field:
     # If field's table is a whole subquery, it would belong solely
     # to that subquery and not the relation we're dealing with.
     if isinstance(field.table, Query):
         raise NotImplementedError("Subqueries are not yet supported")
 
-    matching_fields = []
-    for f in schema.fields:
-        if (
-            f.name == field.name
-            and field.table is None
-            or field.table in schema.relation_ids
-        ):
-            matching_fields.append(f)
+    schema = index.schema
+    if field.table is None:
+        matching_fields = index.by_name.get(field.name, [])
+    elif field.table in schema.relation_ids:
+        # Only fields from the referenced table can match
+        matching_fields = index.by_name_and_table.get(
+            (field.name, field.table), []
+        )
+    else:
+        matching_fields = []
 
-    # If the schema didn't include the field, it should have an unknown type
+    # If the schema didn't include the field, it keeps its type (unknown unless specified), so there's nothing to copy
     if not len(matching_fields):
-        return copy.deepcopy(field)
+        return field
 
     # In the case of there being two identical names, we need there to be only 1 unique field for it.
     if field.table is None:
         assert (
             len(matching_fields) == 1
         ), f"Expected 1 global field matching name {field.name}, got {len(matching_fields)}"
-        dtype = matching_fields[0].data_type
     else:
-        # Find the right table by filtering 1 more time
-        filtered_fields = [
-            f for f in matching_fields if f.source.identifier() == field.table
-        ]
         assert (
-            len(filtered_fields) == 1
+            len(matching_fields) == 1
         ), f"Two ambiguous fields with same name and table found {schema}"
-        dtype = filtered_fields[0].data_type
+    dtype = matching_fields[0].data_type
     return Field(name=field.name, table=field.table, data_type=dtype)
 
 
-def _make_star(star: Star, schema: Schema) -> Star:
+def _make_star(star: Star, index: _SchemaIndex) -> Star:
     if isinstance(star.table, Query):
         raise NotImplementedError("Subqueries are not yet supported")
-    matching_fields = schema.fields
+    matching_fields = index.schema.fields
     if star.table is not None:
-        matching_fields = [
-            f for f in matching_fields if f.source.identifier() == star.table
-        ]
+        matching_fields = index.by_table.get(star.table, [])
     dtype = row(dtypes=[f.data_type for f in matching_fields])
     return Star(table=star.table, data_type=dtype)
 
 
 def resolve_fields(node: Any, schema: Schema) -> Any:
-    if is_listlike(node):
-        return type(node)(resolve_fields(child, schema) for child in node)
-    if is_dictlike(node):
-        return type(node)(
-            (key, resolve_fields(child, schema)) for key, child in node.items()
-        )
-    # Everything that includes Sql members must be Sql itself, even if it doesn't have a non-throwing sql() function
-    # (see JoinConfig for example)
-    if not isinstance(node, Sql):
-        return copy.deepcopy(node)
-    # We don't want to modify data types
-    if isinstance(node, DataType):
-        return copy.deepcopy(node)
-    if isinstance(node, Field):
-        return _make_field(node, schema)
-    if isinstance(node, Star):
-        return _make_star(node, schema)
-    changes: Dict[str, Any] = {}
-    for k, v in children(node).items():
-        changes[k] = resolve_fields(v, schema)
-    return attr.evolve(node, **changes)
+    """Returns a copy of node with the data types of its fields and stars resolved against schema.
+
+    Subtrees that don't contain any fields or stars, or only fields missing from schema, are shared between node and
+    the returned tree rather than copied.
+    Shared nodes are only resolved once per call. Results aren't cached across calls: schemas are rebuilt on every
+    resolve and both schemas and trees can be modified in place, so neither object's identity says whether a previous
+    result is still valid.
+    """
+    return _resolve_fields(node, _SchemaIndex.from_schema(schema))
+
+
+def _resolve_fields(node: Any, index: _SchemaIndex) -> Any:
+    def expand(current: Any) -> Optional[Tuple[List[Any], List[Any]]]:
+        # Most nodes are leaves that are shared as is, so we check for them by their exact type before anything else
+        if type(current) in SHARED_LEAF_TYPES:
+            return None
+        if is_listlike(current):
+            return list(range(len(current))), list(current)
+        if is_dictlike(current):
+            return list(current.keys()), list(current.values())
+        # Everything that includes Sql members must be Sql itself, even if it doesn't have a non-throwing sql()
+        # function (see JoinConfig for example)
+        if not isinstance(current, Sql) or isinstance(
+            current, (DataType, Field, Star)
+        ):
+            return None
+        node_children = children(current)
+        return list(node_children.keys()), list(node_children.values())
+
+    def leaf(current: Any) -> Any:
+        if type(current) in SHARED_LEAF_TYPES:
+            return current
+        if isinstance(current, Field):
+            return _make_field(current, index)
+        if isinstance(current, Star):
+            return _make_star(current, index)
+        # Immutable leaves can be shared between the original and the resolved tree. Data types are treated as
+        # immutable, so we don't need to copy them either
+        if isinstance(current, IMMUTABLE_LEAF_TYPES + (DataType,)):
+            return current
+        return copy.deepcopy(current)
+
+    def combine(
+        current: Any, keys: List[Any], values: List[Any], resolved: List[Any]
+    ) -> Any:
+        # Subtrees without fields come back unchanged, in which case there's nothing to rebuild
+        if all(new is old for new, old in zip(resolved, values)):
+            return current
+        if type(current) is list:
+            # The slice of results is already a new list, so there's no need to copy it into another one
+            return resolved
+        if is_listlike(current):
+            return type(current)(resolved)
+        if is_dictlike(current):
+            return type(current)(zip(keys, resolved))
+        return attr.evolve(current, **dict(zip(keys, resolved)))
+
+    return fold_tree(node, expand, leaf, combine)
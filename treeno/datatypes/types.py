@@ -1,5 +1,6 @@
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 import attr
 
@@ -64,63 +65,62 @@ from treeno.base import GenericVisitor, PrintOptions, Sql
 ]
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class DataType(Sql):
     """Trino data types are used in cast functions and in type verification in the AST.
 
     This class should almost never be used by the client. Please refer to builder for the available
-    builder functions.
+    builder functions. Data types are frozen since instances are shared, i.e. every BIGINT is the same object. For
+    the same reason the parameters are a read-only view over a private copy of the given dict.
     """
 
     type_name: str = attr.ib()
-    parameters: Dict[str, Any] = attr.ib(factory=dict)
+    parameters: Mapping[str, Any] = attr.ib(
+        factory=dict, repr=lambda parameters: repr(dict(parameters))
+    )
 
     def __attrs_post_init__(self):
-        self.type_name = self.type_name.upper()
+        # Mapping the type name onto the constant above makes it the same object, so the many comparisons and set
+        # lookups against those constants are resolved by identity rather than by comparing characters. Names that
+        # are already canonical, which is most of them, skip uppercasing altogether.
+        type_name = _CANONICAL_TYPE_NAMES.get(self.type_name)
+        if type_name is None:
+            type_name = sys.intern(self.type_name.upper())
+        object.__setattr__(self, "type_name", type_name)
+        # _POST_INIT has an entry for every allowed type, so a single hashed lookup both validates the name and fetches
+        # the checks for its parameters, rather than scanning the ALLOWED_TYPES list
+        post_init = _POST_INIT.get(self.type_name)
         assert (
-            self.type_name in ALLOWED_TYPES
+            post_init is not None
         ), f"Type {self.type_name} is not a recognized Trino type."
-        for field in FIELDS[self.type_name]:
-            if not field.required and field.name not in self.parameters:
-                # Unfortunately, because default values can be overridden on the session level,
-                # we want to be hesitant in imputing missing values with a fixed default value.
-                # For example, see hive.timestamp-precision in https://trino.io/docs/current/connector/hive.html
-                # Thus, we only do it when there's a default value
-                if field.default is None:
-                    continue
-                self.parameters[field.name] = field.default
+        # The defaults are filled into a copy so the caller's dict is left alone, and then it's frozen along with the
+        # rest of the data type
+        object.__setattr__(self, "parameters", dict(self.parameters))
+        post_init(self)
+        object.__setattr__(
+            self, "parameters", MappingProxyType(self.parameters)
+        )
 
-            assert (
-                field.name in self.parameters
-            ), f"{field.name} not specified. Required for {self.type_name}"
-            field_value = self.parameters[field.name]
-            assert isinstance(field_value, field.type), (
-                f"Field {field.name} for type {self.type_name} must "
-                f"be of type {field.type.__name__}. "
-                f"Got {type(field_value).__name__} instead with value {field_value})"
-            )
+    def __copy__(self) -> "DataType":
+        return self
 
-        all_parameters = set(param.name for param in FIELDS[self.type_name])
-        current_parameters = set(self.parameters)
-        assert current_parameters.issubset(
-            all_parameters
-        ), f"Expected a subset of parameters from {all_parameters}, got {current_parameters} instead"
-        validator = VALIDATORS.get(self.type_name, None)
-        if validator is not None:
-            validator(self)
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DataType":
+        # Data types are immutable, so copies can share the instance
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The read-only parameters can't be pickled as is, so data types are pickled as the arguments to rebuild them
+        return make_dtype, (self.type_name, dict(self.parameters))
 
     def sql(self, opts: PrintOptions) -> str:
-        if self.type_name in (TIMESTAMP, TIME):
-            return emit_timelike(self)
-        elif self.type_name == INTERVAL:
-            return emit_interval(self)
-        elif self.type_name == ROW:
-            return emit_row(self)
+        emitter = EMITTERS.get(self.type_name)
+        if emitter is not None:
+            return emitter(self)
 
         if not self.parameters:
             return self.type_name
 
-        type_params = FIELDS[self.type_name]
+        type_params = FIELDS.get(self.type_name, ())
         values = []
         # We do this to ensure the order of parameters is outputted correctly.
         # Consider the following situation:
@@ -141,7 +141,7 @@ class DataType(Sql):
         pass
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class TypeParameter:
     name: str = attr.ib()
     required: bool = attr.ib()
@@ -235,46 +235,44 @@ def validate_interval(interval: DataType) -> None:
         ), f"Currently only DAY TO SECOND is allowed, not DAY TO {to_interval}"
 
 
-FIELDS: Dict[str, List[TypeParameter]] = defaultdict(
-    list,
-    {
-        DECIMAL: [
-            # NOTE: According to Trino docs, precision is not optional, but we can still
-            # CAST(3.0 AS DECIMAL) which doesn't have a precision specified (but is inferred).
-            # The response from this thread:
-            # https://trinodb.slack.com/archives/CFLB9AMBN/p1637464297012200
-            # ... should dictate this behavior.
-            TypeParameter("precision", required=False, type=int, default=38),
-            TypeParameter("scale", required=False, type=int, default=0),
-        ],
-        # VARCHAR's max_chars is not required because it can be unbounded, but we can't supply a default for it
-        # because there is no inf representable in integer space. The absence of the parameter shall denote inf.
-        VARCHAR: [TypeParameter("max_chars", required=False, type=int)],
-        CHAR: [TypeParameter("max_chars", required=False, type=int, default=1)],
-        TIME: [
-            # Read TIMESTAMP's explanation for why precision is not required but also doesn't have a default.
-            TypeParameter("precision", required=False, type=int),
-            TypeParameter("timezone", required=False, type=bool, default=False),
-        ],
-        TIMESTAMP: [
-            # Precision is not required, but we also can't supply a reasonable default because
-            # you can use connector session settings to tune the default precision of your queries.
-            TypeParameter("precision", required=False, type=int),
-            TypeParameter("timezone", required=False, type=bool, default=False),
-        ],
-        ARRAY: [TypeParameter("dtype", required=True, type=DataType)],
-        MAP: [
-            TypeParameter("from_dtype", required=True, type=DataType),
-            TypeParameter("to_dtype", required=True, type=DataType),
-        ],
-        ROW: [TypeParameter("dtypes", required=True, type=list)],
-        INTERVAL: [
-            TypeParameter("from_interval", required=True, type=str),
-            TypeParameter("to_interval", required=True, type=str),
-        ],
-        QDIGEST: [TypeParameter("dtype", required=True, type=DataType)],
-    },
-)
+# Read-only after import. Types without parameters are missing, so look types up with FIELDS.get(type_name, ()).
+FIELDS: Dict[str, Tuple[TypeParameter, ...]] = {
+    DECIMAL: (
+        # NOTE: According to Trino docs, precision is not optional, but we can still
+        # CAST(3.0 AS DECIMAL) which doesn't have a precision specified (but is inferred).
+        # The response from this thread:
+        # https://trinodb.slack.com/archives/CFLB9AMBN/p1637464297012200
+        # ... should dictate this behavior.
+        TypeParameter("precision", required=False, type=int, default=38),
+        TypeParameter("scale", required=False, type=int, default=0),
+    ),
+    # VARCHAR's max_chars is not required because it can be unbounded, but we can't supply a default for it
+    # because there is no inf representable in integer space. The absence of the parameter shall denote inf.
+    VARCHAR: (TypeParameter("max_chars", required=False, type=int),),
+    CHAR: (TypeParameter("max_chars", required=False, type=int, default=1),),
+    TIME: (
+        # Read TIMESTAMP's explanation for why precision is not required but also doesn't have a default.
+        TypeParameter("precision", required=False, type=int),
+        TypeParameter("timezone", required=False, type=bool, default=False),
+    ),
+    TIMESTAMP: (
+        # Precision is not required, but we also can't supply a reasonable default because
+        # you can use connector session settings to tune the default precision of your queries.
+        TypeParameter("precision", required=False, type=int),
+        TypeParameter("timezone", required=False, type=bool, default=False),
+    ),
+    ARRAY: (TypeParameter("dtype", required=True, type=DataType),),
+    MAP: (
+        TypeParameter("from_dtype", required=True, type=DataType),
+        TypeParameter("to_dtype", required=True, type=DataType),
+    ),
+    ROW: (TypeParameter("dtypes", required=True, type=list),),
+    INTERVAL: (
+        TypeParameter("from_interval", required=True, type=str),
+        TypeParameter("to_interval", required=True, type=str),
+    ),
+    QDIGEST: (TypeParameter("dtype", required=True, type=DataType),),
+}
 
 VALIDATORS: Dict[str, Callable[[DataType], None]] = {
     BOOLEAN: validate_nonparametric,
@@ -302,3 +300,89 @@ VALIDATORS: Dict[str, Callable[[DataType], None]] = {
     INTERVAL: validate_interval,
     DECIMAL: validate_decimal,
 }
+
+# Types whose SQL isn't just the type name followed by its parameters in parentheses
+EMITTERS: Dict[str, Callable[[DataType], str]] = {
+    TIME: emit_timelike,
+    TIMESTAMP: emit_timelike,
+    INTERVAL: emit_interval,
+    ROW: emit_row,
+}
+
+
+def _make_post_init(type_name: str) -> Callable[[DataType], None]:
+    """Builds the checks that DataType runs on construction for the given type.
+
+    The set of types is fixed, so the parameters and validator of each type are looked up once here rather than on
+    every construction.
+    """
+    type_parameters = FIELDS.get(type_name, ())
+    validator = VALIDATORS.get(type_name, None)
+    if validator is validate_nonparametric:
+        # There are no parameters to fill in or type check, so all that's left is asserting that none were passed
+        return validator
+    parameter_names = frozenset(param.name for param in type_parameters)
+
+    def post_init(dtype: DataType) -> None:
+        parameters = dtype.parameters
+        for field in type_parameters:
+            if not field.required and field.name not in parameters:
+                # Unfortunately, because default values can be overridden on the session level,
+                # we want to be hesitant in imputing missing values with a fixed default value.
+                # For example, see hive.timestamp-precision in https://trino.io/docs/current/connector/hive.html
+                # Thus, we only do it when there's a default value
+                if field.default is None:
+                    continue
+                parameters[field.name] = field.default
+
+            assert (
+                field.name in parameters
+            ), f"{field.name} not specified. Required for {type_name}"
+            field_value = parameters[field.name]
+            assert isinstance(field_value, field.type), (
+                f"Field {field.name} for type {type_name} must "
+                f"be of type {field.type.__name__}. "
+                f"Got {type(field_value).__name__} instead with value {field_value})"
+            )
+
+        # issuperset takes the parameters dict as is, so no set is built unless the assertion fails
+        assert parameter_names.issuperset(
+            parameters
+        ), f"Expected a subset of parameters from {set(parameter_names)}, got {set(parameters)} instead"
+        if validator is not None:
+            validator(dtype)
+
+    return post_init
+
+
+_POST_INIT: Dict[str, Callable[[DataType], None]] = {
+    type_name: _make_post_init(type_name) for type_name in ALLOWED_TYPES
+}
+
+_CANONICAL_TYPE_NAMES: Dict[str, str] = {
+    type_name: type_name for type_name in ALLOWED_TYPES
+}
+
+# Nonparametric types are all alike, and data types are treated as immutable, so a single instance of each is shared
+_NONPARAMETRIC_DTYPES: Dict[str, DataType] = {
+    type_name: DataType(type_name)
+    for type_name, validator in VALIDATORS.items()
+    if validator is validate_nonparametric
+}
+
+
+def make_dtype(
+    type_name: str, parameters: Optional[Dict[str, Any]] = None
+) -> DataType:
+    """Constructs a data type, reusing the shared instance for nonparametric types.
+
+    Prefer this over calling DataType directly when the type name comes from user input, since most of those types
+    are nonparametric.
+    """
+    if not parameters:
+        dtype = _NONPARAMETRIC_DTYPES.get(type_name)
+        if dtype is None:
+            dtype = _NONPARAMETRIC_DTYPES.get(type_name.upper())
+        if dtype is not None:
+            return dtype
+    return DataType(type_name, parameters=parameters or {})
@@ -31,9 +31,22 @@ support ``decimal.Decimal`` types for fixed precision decimal point classes in p
 which cannot be wrapped to a literal. Instead, please use the :data:`NULL` singleton.
 """
 import functools
+import warnings
 from abc import ABC
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import attr
 
@@ -57,7 +70,7 @@ from treeno.datatypes.inference import (
     infer_timelike_precision,
     infer_type,
 )
-from treeno.datatypes.types import DataType
+from treeno.datatypes.types import DataType, make_dtype
 from treeno.printer import join_stmts, pad
 from treeno.util import (
     chain_identifiers,
@@ -72,7 +85,10 @@ from treeno.util import (
 GenericValue = TypeVar("GenericValue", bound="Value")
 
 # Attr tries to assign __le__, __ge__, __eq__ and friends by default. We define our own.
-value_attr = functools.partial(attr.s, order=False, eq=False, str=False)
+# Values are slotted since trees can have many of them, and they're accessed constantly while printing and resolving.
+value_attr = functools.partial(
+    attr.s, order=False, eq=False, str=False, slots=True
+)
 
 
 @value_attr
@@ -95,7 +111,8 @@ class Value(Sql, ABC):
             be directly determined.
     """
 
-    data_type: DataType = attr.ib(factory=unknown, kw_only=True)
+    # Data types are immutable, so every value can share the same UNKNOWN instance rather than calling a factory
+    data_type: DataType = attr.ib(default=unknown(), kw_only=True)
 
     def __invert__(self):
         return Not(self)
@@ -213,17 +230,14 @@ class Literal(Value):
             ), "Please use wrap_literal to construct a Literal value so the data types are detected"
 
     def sql(self, opts: PrintOptions) -> str:
+        render = _LITERAL_RENDERERS.get(type(self.value))
+        if render is not None:
+            return render(self.value)
+        if isinstance(self.value, str):
+            return quote_literal(self.value)
         # NOTE: Literal decimals can be directly convertible
         # through string representation, i.e. 3.14 is DECIMAL(3,2), so we don't need to do anything.
-        s = str(self.value)
-        if self.value is None:
-            s = "NULL"
-        if isinstance(self.value, bool):
-            s = s.upper()
-        if isinstance(self.value, str):
-            # Single quotes to mean literal string
-            s = quote_literal(self.value)
-        return s
+        return str(self.value)
 
     def visit(self, visitor: GenericVisitor) -> None:
         # We assume the value underneath is not a Sql object but rather a
@@ -231,6 +245,18 @@ class Literal(Value):
         pass
 
 
+# How Literal prints values of each exact python type, so the type only has to be checked once per literal
+_LITERAL_RENDERERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "NULL",
+    bool: lambda value: "TRUE" if value else "FALSE",
+    # Single quotes to mean literal string
+    str: quote_literal,
+    int: str,
+    float: str,
+    Decimal: str,
+}
+
+
 @value_attr
 class Field(Value):
     """Represents a field referenced in the input relations of a SELECT query
@@ -329,7 +355,7 @@ class AliasedStar(Value):
     """Represents one or more aliases corresponding to an unpacked star"""
 
     star: Star = attr.ib()
-    aliases: List[str] = attr.ib()
+    aliases: Tuple[str, ...] = attr.ib(converter=tuple)
 
     def __attrs_post_init__(self) -> None:
         self.data_type = self.star.data_type
@@ -342,27 +368,32 @@ class AliasedStar(Value):
         visitor.visit(self.star)
 
 
+@value_attr
+class LambdaVariable(Value):
+    """Represents an input variable of a lambda. It's also exposed as Lambda.Variable."""
+
+    name: str = attr.ib()
+
+    def sql(self, opts: PrintOptions) -> str:
+        return self.name
+
+    def identifier(self) -> Optional[str]:
+        return self.name
+
+    def visit(self, visitor: GenericVisitor) -> None:
+        # This variable should not directly reference anything as of right now
+        pass
+
+
 @value_attr
 class Lambda(Expression):
     """Represents an anonymous function. This expression will currently have an unknown type because it can never be
     expressed as a standalone expression.
     """
 
-    @value_attr
-    class Variable(Value):
-        name: str = attr.ib()
-
-        def sql(self, opts: PrintOptions) -> str:
-            return self.name
-
-        def identifier(self) -> Optional[str]:
-            return self.name
-
-        def visit(self, visitor: GenericVisitor) -> None:
-            # This variable should not directly reference anything as of right now
-            pass
+    Variable = LambdaVariable
 
-    inputs: List[Variable] = attr.ib()
+    inputs: Tuple[LambdaVariable, ...] = attr.ib(converter=tuple)
     expr: Value = attr.ib()
 
     def __attrs_post_init__(self):
@@ -370,20 +401,24 @@ class Lambda(Expression):
 
     @classmethod
     def from_generic_expr(
-        cls, inputs: List[Variable], expr: GenericValue
+        cls, inputs: List[LambdaVariable], expr: GenericValue
     ) -> "Lambda":
         input_set = set(input.name for input in inputs)
 
+        # Only the nodes on the path to a variable are rebuilt, everything else is shared with expr as is
         def _from_expr(node: Any) -> Any:
             if is_listlike(node):
-                return construct_container(
-                    node, iter(_from_expr(child) for child in node)
-                )
+                new_children = [_from_expr(child) for child in node]
+                if all(new is old for new, old in zip(new_children, node)):
+                    return node
+                return construct_container(node, iter(new_children))
             if is_dictlike(node):
-                return construct_container(
-                    node,
-                    iter((k, _from_expr(child)) for k, child in node.items()),
-                )
+                new_items = [
+                    (k, _from_expr(child)) for k, child in node.items()
+                ]
+                if all(new is node[k] for k, new in new_items):
+                    return node
+                return construct_container(node, iter(new_items))
             if not isinstance(node, Sql):
                 return node
             if (
@@ -391,10 +426,14 @@ class Lambda(Expression):
                 and node.table is None
                 and node.name in input_set
             ):
-                return cls.Variable(node.name)
+                return LambdaVariable(node.name)
             changes = {}
             for k, v in children(node).items():
-                changes[k] = _from_expr(v)
+                new_v = _from_expr(v)
+                if new_v is not v:
+                    changes[k] = new_v
+            if not changes:
+                return node
             return attr.evolve(node, **changes)
 
         return cls(inputs, _from_expr(expr))
@@ -411,9 +450,18 @@ class Lambda(Expression):
         visitor.visit(self.expr)
 
 
+# Concrete Value classes seen by wrap_literal so far. Value is an ABC, so isinstance goes through ABCMeta's
+# __instancecheck__ which is several times slower than a set lookup on the exact type.
+_VALUE_TYPES: Set[type] = set()
+
+
 def wrap_literal(val: Any) -> Value:
     """Convenience method to wrap a literal value into a treeno Value"""
+    val_type = type(val)
+    if val_type in _VALUE_TYPES:
+        return val
     if isinstance(val, Value):
+        _VALUE_TYPES.add(val_type)
         return val
     if val is None:
         raise ValueError(
@@ -422,11 +470,22 @@ def wrap_literal(val: Any) -> Value:
     assert not isinstance(
         val, (list, tuple, set, dict)
     ), "wrap_literal should not be used with composable types like ARRAY/MAP/ROW"
+    # Inferred types are never UNKNOWN, so there's nothing for Literal's post init to check
     return Literal(val, data_type=infer_type(val))
 
 
+def wrap_literal_tuple(vals: Iterable[Any]) -> Tuple[Value, ...]:
+    return tuple(map(wrap_literal, vals))
+
+
 def wrap_literal_list(vals: List[Any]) -> List[Value]:
-    return [wrap_literal(val) for val in vals]
+    """Deprecated, use wrap_literal_tuple instead."""
+    warnings.warn(
+        "wrap_literal_list is deprecated, use wrap_literal_tuple instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return list(wrap_literal_tuple(vals))
 
 
 def pemdas_str(
@@ -445,27 +504,47 @@ def pemdas_str(
     """
     # If the type is not specified, we assume the syntax is well-formed without any parentheses as it's probably a fn
     # call.
-    val_type = type(val)
-    if (
-        current_type not in OPERATOR_PRECEDENCE
-        or val_type not in OPERATOR_PRECEDENCE
-    ):
+    current_precedence = OPERATOR_PRECEDENCE.get(current_type)
+    if current_precedence is None:
+        return val.sql(opts)
+    val_precedence = OPERATOR_PRECEDENCE.get(type(val))
+    if val_precedence is None:
         return val.sql(opts)
-    current_precedence = OPERATOR_PRECEDENCE[current_type]
-    val_precedence = OPERATOR_PRECEDENCE[val_type]
-    # The expression's precedence is the same, so we must obey left-to-right ordering.
-    if current_precedence == val_precedence:
-        if is_left:
-            return val.sql(opts)
-        else:
-            return parenthesize(val)
-
     # The underlying value's precedence is lower, BUT it's deeper in the tree, which means we need to parenthesize it.
-    if val_precedence < current_precedence:
+    # If the precedence is the same, we must obey left-to-right ordering so only the right child is parenthesized.
+    if val_precedence < current_precedence or (
+        val_precedence == current_precedence and not is_left
+    ):
         return parenthesize(val)
     return val.sql(opts)
 
 
+class _BooleanExpression:
+    """Mixin for expressions that always evaluate to a BOOLEAN, such as comparisons and logical operators.
+
+    It has to come before the attrs base class so its post init is the one attrs calls.
+    """
+
+    __slots__ = ()
+
+    def __attrs_post_init__(self) -> None:
+        self.data_type = boolean()
+
+
+class _ArithmeticExpression:
+    """Mixin for arithmetic binary expressions, whose type is derived from both operands' types.
+
+    Like _BooleanExpression, it has to come before the attrs base class.
+    """
+
+    __slots__ = ()
+
+    def __attrs_post_init__(self) -> None:
+        self.data_type = get_arithmetic_type(
+            self.left.data_type, self.right.data_type
+        )
+
+
 @value_attr
 class BinaryExpression(Expression, ABC):
     left: Value = attr.ib(converter=wrap_literal)
@@ -485,20 +564,37 @@ class UnaryExpression(Expression, ABC):
 
 
 def builtin_binary_str(
-    val: BinaryExpression, string_format: str, opts: PrintOptions
+    val: BinaryExpression, operator: str, opts: PrintOptions
 ) -> str:
-    return string_format.format(
-        left=pemdas_str(type(val), val.left, opts, is_left=True),
-        right=pemdas_str(type(val), val.right, opts, is_left=False),
-    )
+    """Prints a binary expression as its left operand, then the operator (including any whitespace around it), then
+    its right operand."""
+    val_type = type(val)
+    rights = [val.right]
+    left = val.left
+    # Left-deep chains of the same operator (i.e. a AND b AND c ...) never need parentheses on the left, so they're
+    # flattened and printed in a loop. Otherwise long chains recurse once per operand and would be concatenated one
+    # level at a time.
+    if val_type in _CHAINABLE_OPERATORS:
+        while type(left) is val_type:
+            rights.append(left.right)
+            left = left.left
+    parts = [pemdas_str(val_type, left, opts, is_left=True)]
+    for right in reversed(rights):
+        parts.append(operator)
+        parts.append(pemdas_str(val_type, right, opts, is_left=False))
+    return "".join(parts)
 
 
 def builtin_unary_str(
-    val: UnaryExpression, string_format: str, opts: PrintOptions
+    val: UnaryExpression,
+    opts: PrintOptions,
+    prefix: str = "",
+    suffix: str = "",
 ) -> str:
-    return string_format.format(
-        value=pemdas_str(type(val), val.value, opts, is_left=True)
-    )
+    """Prints a unary expression as its operand, surrounded by the operator's prefix and suffix (including any
+    whitespace)."""
+    value = pemdas_str(type(val), val.value, opts, is_left=True)
+    return f"{prefix}{value}{suffix}"
 
 
 @value_attr
@@ -507,7 +603,7 @@ class Positive(UnaryExpression):
         self.data_type = self.value.data_type
 
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_unary_str(self, "+{value}", opts)
+        return builtin_unary_str(self, opts, prefix="+")
 
 
 @value_attr
@@ -516,193 +612,130 @@ class Negative(UnaryExpression):
         self.data_type = self.value.data_type
 
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_unary_str(self, "-{value}", opts)
+        return builtin_unary_str(self, opts, prefix="-")
 
 
 @value_attr
-class Add(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = get_arithmetic_type(
-            self.left.data_type, self.right.data_type
-        )
-
+class Add(_ArithmeticExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} + {right}", opts)
+        return builtin_binary_str(self, " + ", opts)
+
+
+_DATE_OR_TIMESTAMP = frozenset((type_consts.DATE, type_consts.TIMESTAMP))
+_DAY_TO_SECOND = interval(from_interval="DAY", to_interval="SECOND")
 
 
 @value_attr
-class Minus(BinaryExpression):
+class Minus(_ArithmeticExpression, BinaryExpression):
     def __attrs_post_init__(self) -> None:
-        self.data_type = get_arithmetic_type(
-            self.left.data_type, self.right.data_type
-        )
         # Special minus operators for datetimes
-        left_name, right_name = (
-            self.left.data_type.type_name,
-            self.right.data_type.type_name,
-        )
-        if {left_name, right_name}.issubset(
-            {type_consts.TIMESTAMP, type_consts.DATE}
+        left_name = self.left.data_type.type_name
+        right_name = self.right.data_type.type_name
+        if (
+            left_name in _DATE_OR_TIMESTAMP and right_name in _DATE_OR_TIMESTAMP
         ) or left_name == right_name == type_consts.TIME:
-            self.data_type = interval(from_interval="DAY", to_interval="SECOND")
+            self.data_type = _DAY_TO_SECOND
+        else:
+            super().__attrs_post_init__()
 
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} - {right}", opts)
+        return builtin_binary_str(self, " - ", opts)
 
 
 @value_attr
-class Multiply(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = get_arithmetic_type(
-            self.left.data_type, self.right.data_type
-        )
-
+class Multiply(_ArithmeticExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} * {right}", opts)
+        return builtin_binary_str(self, " * ", opts)
 
 
 @value_attr
-class Divide(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = get_arithmetic_type(
-            self.left.data_type, self.right.data_type
-        )
-
+class Divide(_ArithmeticExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} / {right}", opts)
+        return builtin_binary_str(self, " / ", opts)
 
 
 @value_attr
-class Not(UnaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class Not(_BooleanExpression, UnaryExpression):
     def sql(self, opts: PrintOptions) -> str:
         # Specializations on Not
-        if isinstance(
-            self.value,
-            (
-                DistinctFrom,
-                IsNull,
-                Like,
-                InList,
-                InQuery,
-                Between,
-                Equal,
-                NotEqual,
-            ),
-        ):
+        if type(self.value) in _NEGATABLE_TYPES:
             return self.value.to_string(opts, negate=True)
 
-        return builtin_unary_str(self, "NOT {value}", opts)
+        return builtin_unary_str(self, opts, prefix="NOT ")
 
 
 @value_attr
-class Modulus(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = get_arithmetic_type(
-            self.left.data_type, self.right.data_type
-        )
-
+class Modulus(_ArithmeticExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} % {right}", opts)
+        return builtin_binary_str(self, " % ", opts)
 
 
 @value_attr
-class Equal(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class Equal(_BooleanExpression, BinaryExpression):
     def to_string(self, opts: PrintOptions, negate: bool = False) -> str:
         if negate:
             return NotEqual(self.left, self.right).sql(opts)
-        return builtin_binary_str(self, "{left} = {right}", opts)
+        return builtin_binary_str(self, " = ", opts)
 
     def sql(self, opts: PrintOptions) -> str:
         return self.to_string(opts, negate=False)
 
 
 @value_attr
-class NotEqual(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class NotEqual(_BooleanExpression, BinaryExpression):
     def to_string(self, opts: PrintOptions, negate: bool = False) -> str:
         if negate:
             return str(Equal(self.left, self.right))
-        return builtin_binary_str(self, "{left} <> {right}", opts)
+        return builtin_binary_str(self, " <> ", opts)
 
     def sql(self, opts: PrintOptions) -> str:
         return self.to_string(opts, negate=False)
 
 
 @value_attr
-class GreaterThan(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class GreaterThan(_BooleanExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} > {right}", opts)
+        return builtin_binary_str(self, " > ", opts)
 
 
 @value_attr
-class GreaterThanOrEqual(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class GreaterThanOrEqual(_BooleanExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} >= {right}", opts)
+        return builtin_binary_str(self, " >= ", opts)
 
 
 @value_attr
-class LessThan(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class LessThan(_BooleanExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} < {right}", opts)
+        return builtin_binary_str(self, " < ", opts)
 
 
 @value_attr
-class LessThanOrEqual(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class LessThanOrEqual(_BooleanExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        return builtin_binary_str(self, "{left} <= {right}", opts)
+        return builtin_binary_str(self, " <= ", opts)
 
 
 @value_attr
-class And(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class And(_BooleanExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
         # According to the specifications, AND and OR should be on the next line if we're in pretty mode
-        spacing = "\n" if opts.mode == PrintMode.PRETTY else " "
-        return builtin_binary_str(
-            self, "{left}" + spacing + "AND {right}", opts
-        )
+        operator = "\nAND " if opts.mode == PrintMode.PRETTY else " AND "
+        return builtin_binary_str(self, operator, opts)
 
 
 @value_attr
-class Or(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class Or(_BooleanExpression, BinaryExpression):
     def sql(self, opts: PrintOptions) -> str:
-        spacing = "\n" if opts.mode == PrintMode.PRETTY else " "
-        return builtin_binary_str(self, "{left}" + spacing + "OR {right}", opts)
+        operator = "\nOR " if opts.mode == PrintMode.PRETTY else " OR "
+        return builtin_binary_str(self, operator, opts)
 
 
 @value_attr
-class IsNull(UnaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class IsNull(_BooleanExpression, UnaryExpression):
     def to_string(self, opts: PrintOptions, negate: bool = False):
         return builtin_unary_str(
-            self, "{value} IS NOT NULL" if negate else "{value} IS NULL", opts
+            self, opts, suffix=" IS NOT NULL" if negate else " IS NULL"
         )
 
     def sql(self, opts: PrintOptions) -> str:
@@ -710,16 +743,11 @@ class IsNull(UnaryExpression):
 
 
 @value_attr
-class DistinctFrom(BinaryExpression):
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
+class DistinctFrom(_BooleanExpression, BinaryExpression):
     def to_string(self, opts: PrintOptions, negate: bool = False):
         return builtin_binary_str(
             self,
-            "{left} IS NOT DISTINCT FROM {right}"
-            if negate
-            else "{left} IS DISTINCT FROM {right}",
+            " IS NOT DISTINCT FROM " if negate else " IS DISTINCT FROM ",
             opts,
         )
 
@@ -728,20 +756,18 @@ class DistinctFrom(BinaryExpression):
 
 
 @value_attr
-class Between(Expression):
+class Between(_BooleanExpression, Expression):
     value: Value = attr.ib(converter=wrap_literal)
     lower: Value = attr.ib(converter=wrap_literal)
     upper: Value = attr.ib(converter=wrap_literal)
 
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
     def to_string(self, opts: PrintOptions, negate: bool = False) -> str:
-        between_string = pemdas_str(type(self), self.value, opts)
-        if negate:
-            between_string += " NOT"
-        between_string += f" BETWEEN {pemdas_str(type(self), self.lower, opts)} AND {pemdas_str(type(self), self.upper, opts)}"
-        return between_string
+        current_type = type(self)
+        value_str = pemdas_str(current_type, self.value, opts)
+        not_str = " NOT" if negate else ""
+        lower_str = pemdas_str(current_type, self.lower, opts)
+        upper_str = pemdas_str(current_type, self.upper, opts)
+        return f"{value_str}{not_str} BETWEEN {lower_str} AND {upper_str}"
 
     def sql(self, opts: PrintOptions) -> str:
         return self.to_string(opts, negate=False)
@@ -754,7 +780,7 @@ class Between(Expression):
 
 @value_attr
 class Array(Expression):
-    values: List[Value] = attr.ib(converter=wrap_literal_list)
+    values: Tuple[Value, ...] = attr.ib(converter=wrap_literal_tuple)
 
     def __attrs_post_init__(self) -> None:
         assert len(self.values), "values must be a non-empty list for Array"
@@ -776,19 +802,14 @@ class Array(Expression):
 
 
 @value_attr
-class InQuery(Expression):
+class InQuery(_BooleanExpression, Expression):
     value: Value = attr.ib(converter=wrap_literal)
     query: "treeno.relation.Query" = attr.ib()
 
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
     def to_string(self, opts: PrintOptions, negate: bool = False) -> str:
-        in_list_string = pemdas_str(type(self), self.value, opts)
-        if negate:
-            in_list_string += " NOT"
-        in_list_string += f" IN ({self.query.sql(opts)})"
-        return in_list_string
+        value_str = pemdas_str(type(self), self.value, opts)
+        not_str = " NOT" if negate else ""
+        return f"{value_str}{not_str} IN ({self.query.sql(opts)})"
 
     def sql(self, opts: PrintOptions) -> str:
         return self.to_string(opts, negate=False)
@@ -799,20 +820,15 @@ class InQuery(Expression):
 
 
 @value_attr
-class InList(Expression):
+class InList(_BooleanExpression, Expression):
     value: Value = attr.ib(converter=wrap_literal)
-    exprs: List[Value] = attr.ib(converter=wrap_literal_list)
-
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
+    exprs: Tuple[Value, ...] = attr.ib(converter=wrap_literal_tuple)
 
     def to_string(self, opts: PrintOptions, negate: bool = False) -> str:
         expr_list = join_stmts([expr.sql(opts) for expr in self.exprs], opts)
-        in_list_string = pemdas_str(type(self), self.value, opts)
-        if negate:
-            in_list_string += " NOT"
-        in_list_string += f" IN ({expr_list})"
-        return in_list_string
+        value_str = pemdas_str(type(self), self.value, opts)
+        not_str = " NOT" if negate else ""
+        return f"{value_str}{not_str} IN ({expr_list})"
 
     def sql(self, opts: PrintOptions) -> str:
         return self.to_string(opts, negate=False)
@@ -824,25 +840,23 @@ class InList(Expression):
 
 
 @value_attr
-class Like(Expression):
+class Like(_BooleanExpression, Expression):
     value: Value = attr.ib(converter=wrap_literal)
     pattern: Value = attr.ib(converter=wrap_literal)
     escape: Optional[Value] = attr.ib(
         default=None, converter=attr.converters.optional(wrap_literal)
     )
 
-    def __attrs_post_init__(self) -> None:
-        self.data_type = boolean()
-
     def to_string(self, opts: PrintOptions, negate: bool = False) -> str:
-        like_str = pemdas_str(type(self), self.value, opts)
-        if negate:
-            like_str += " NOT"
-        like_str += f" LIKE {pemdas_str(type(self), self.pattern, opts)}"
-        if self.escape:
-            # TODO: Should we pemdas this? I don't see it in the specs
-            like_str += f" ESCAPE {self.escape.sql(opts)}"
-        return like_str
+        current_type = type(self)
+        value_str = pemdas_str(current_type, self.value, opts)
+        not_str = " NOT" if negate else ""
+        pattern_str = pemdas_str(current_type, self.pattern, opts)
+        if not self.escape:
+            return f"{value_str}{not_str} LIKE {pattern_str}"
+        # TODO: Should we pemdas this? I don't see it in the specs
+        escape_str = self.escape.sql(opts)
+        return f"{value_str}{not_str} LIKE {pattern_str} ESCAPE {escape_str}"
 
     def sql(self, opts: PrintOptions) -> str:
         return self.to_string(opts, negate=False)
@@ -874,7 +888,7 @@ class TypeConstructor(Expression):
         elif self.type_name == type_consts.CHAR:
             self.data_type = infer_char(self.value)
         else:
-            self.data_type = DataType(self.type_name)
+            self.data_type = make_dtype(self.type_name)
 
     def sql(self, opts: PrintOptions) -> str:
         # We aren't allowed to parametrize the types here.
@@ -889,7 +903,7 @@ class TypeConstructor(Expression):
 
 @value_attr
 class RowConstructor(Expression):
-    values: List[Value] = attr.ib()
+    values: Tuple[Value, ...] = attr.ib(converter=tuple)
 
     def __attrs_post_init__(self) -> None:
         self.data_type = row(dtypes=[value.data_type for value in self.values])
@@ -1072,5 +1086,17 @@ OPERATOR_PRECEDENCE: Dict[Type[Value], int] = {
     Or: 0,
 }
 
+# Operators whose SQL is always their builtin_binary_str, which makes it safe to print chains of them in one go. This
+# excludes i.e. DistinctFrom, which can be negated by its parent.
+_CHAINABLE_OPERATORS = frozenset(
+    (Add, Minus, Multiply, Divide, Modulus, And, Or)
+)
+
+# Expressions with a to_string(opts, negate) method, which Not uses to print i.e. "a IS NOT NULL" rather than
+# "NOT a IS NULL"
+_NEGATABLE_TYPES = frozenset(
+    (DistinctFrom, IsNull, Like, InList, InQuery, Between, Equal, NotEqual)
+)
+
 # Use this instead of wrap_literal(None), which we explicitly disallow
 NULL = Literal(None, data_type=unknown())
@@ -2,7 +2,7 @@
 concat can be used to concat strings, varbinary, arrays, etc.
 """
 import functools
-from typing import Any, ClassVar, List, Type
+from typing import Any, ClassVar, List, Tuple, Type
 
 import attr
 
@@ -18,7 +18,7 @@ from treeno.expression import (
     OPERATOR_PRECEDENCE,
     Value,
     value_attr,
-    wrap_literal_list,
+    wrap_literal_tuple,
 )
 from treeno.functions.base import Function, GenericFunction
 
@@ -74,7 +74,7 @@ def _get_string_concat_type(
 @value_attr
 class Concatenate(Function):
     FN_NAME: ClassVar[str] = "CONCAT"
-    values: List[Value] = attr.ib(converter=wrap_literal_list)
+    values: Tuple[Value, ...] = attr.ib(converter=wrap_literal_tuple)
 
     def __attrs_post_init__(self) -> None:
         dtypes = [value.data_type for value in self.values]
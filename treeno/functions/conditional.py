@@ -1,12 +1,17 @@
 import functools
-from typing import Any, ClassVar, List, Optional, Type
+from typing import Any, ClassVar, Optional, Tuple, Type
 
 import attr
 
 from treeno.base import GenericVisitor, PrintOptions
 from treeno.datatypes.builder import unknown
 from treeno.datatypes.conversions import common_supertype
-from treeno.expression import Value, value_attr, wrap_literal, wrap_literal_list
+from treeno.expression import (
+    Value,
+    value_attr,
+    wrap_literal,
+    wrap_literal_tuple,
+)
 from treeno.functions.base import Function, GenericFunction
 
 
@@ -43,7 +48,7 @@ class If(Function):
 @value_attr
 class Coalesce(Function):
     FN_NAME: ClassVar[str] = "COALESCE"
-    values: List[Value] = attr.ib(converter=wrap_literal_list)
+    values: Tuple[Value, ...] = attr.ib(converter=wrap_literal_tuple)
 
     def __attrs_post_init__(self) -> None:
         dtypes = [
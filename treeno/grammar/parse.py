@@ -1,6 +1,5 @@
 from io import StringIO
 
-import nltk
 from antlr4 import CommonTokenStream
 from antlr4.InputStream import InputStream
 from antlr4.ParserRuleContext import ParserRuleContext
@@ -44,6 +43,9 @@ class AST:
 
 
 def tree(ast: AST, node: ParserRuleContext) -> str:
+    # nltk is slow to import and only needed for drawing parse trees
+    import nltk
+
     parenthetical_tree = nltk.Tree.fromstring(
         Trees.toStringTree(node, None, ast.parser())
     )
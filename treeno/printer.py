@@ -47,6 +47,9 @@ class JoinPrinter:
 
     def to_string(self, opts: PrintOptions) -> str:
         assert opts.spaces < self.max_length
+        # Statements are only ever wrapped in pretty mode, otherwise they're joined as is
+        if opts.mode != PrintMode.PRETTY:
+            return self.delimiter.join(self.stmt_list)
         remaining_length = self.max_length - opts.spaces
         lines = []
         current_length = 0
@@ -55,10 +58,7 @@ class JoinPrinter:
             needs_comma = int(idx < len(self.stmt_list) - 1)
             line_length = len(line) + needs_comma
             # If a line is simply too long, we can't do anything about it but to include it in its own line.
-            if (
-                opts.mode == PrintMode.PRETTY
-                and current_length + line_length > remaining_length
-            ):
+            if current_length + line_length > remaining_length:
                 current_length = line_length
                 # If we're at the beginning of the line, we shouldn't add a newline
                 newline_if_not_beginning = "\n" if idx != 0 else ""
@@ -477,7 +477,8 @@ class SelectQuery(Query):
             schema = self.from_.resolve(
                 maybe_prune_schema(self.from_, existing_schema)
             )
-            self.select = [resolve_fields(val, schema) for val in self.select]
+            # Resolve the whole list at once so the schema is only indexed once
+            self.select = resolve_fields(self.select, schema)
             self.data_type = self._compute_data_type()
 
         schema_fields = []
@@ -1001,9 +1002,7 @@ class Unnest(Relation):
         from treeno.datatypes.resolve import resolve_fields
 
         # There's no base
-        self.arrays = [
-            resolve_fields(arr, existing_schema) for arr in self.arrays
-        ]
+        self.arrays = resolve_fields(self.arrays, existing_schema)
         self.data_type = self._compute_data_type()
         return Schema(
             fields=[
@@ -1,14 +1,17 @@
+import functools
 import inspect
 import itertools
 from abc import ABC
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -64,9 +67,17 @@ def construct_container(var: Iterable[T], it: Iterator[T]) -> Iterable[T]:
     return type(var)(it)
 
 
+@functools.lru_cache(maxsize=None)
+def child_names(cls: Type["Sql"]) -> Tuple[str, ...]:
+    """Names of the attrs fields of a Sql class, computed once per class rather than per instance."""
+    return tuple(field.name for field in attr.fields(cls))
+
+
 def children(sql: "Sql") -> Dict[str, Any]:
-    fields_dict = attr.fields_dict(type(sql))
-    return {field_name: getattr(sql, field_name) for field_name in fields_dict}
+    return {
+        field_name: getattr(sql, field_name)
+        for field_name in child_names(type(sql))
+    }
 
 
 def is_abstract(cls: Type[T]) -> bool:
@@ -82,3 +93,55 @@ def is_abstract(cls: Type[T]) -> bool:
         return True
     else:
         return has_abc_inheritance
+
+
+def fold_tree(
+    node: Any,
+    expand: Callable[[Any], Optional[Tuple[List[Any], List[Any]]]],
+    leaf: Callable[[Any], T],
+    combine: Callable[[Any, List[Any], List[Any], List[T]], T],
+) -> T:
+    """Folds a tree of Sql nodes and containers into a single result, bottom up.
+
+    Args:
+        node: The root of the tree.
+        expand: Returns the keys and values of a node's children, or None if the node should be treated as a leaf.
+        leaf: Computes the result of a leaf.
+        combine: Computes the result of a node given its keys, its children and the results of its children, in the
+            same order as expand returned them.
+    """
+    from treeno.base import Sql
+
+    # We traverse iteratively in post-order so deeply nested trees don't hit python's recursion limit. A stack entry is
+    # either (node, None, None) for a node that hasn't been expanded yet, or (node, keys, values) for a node whose
+    # children have been pushed and whose result can be combined from the last len(keys) results.
+    stack: List[Tuple[Any, Optional[List[Any]], Optional[List[Any]]]] = [
+        (node, None, None)
+    ]
+    results: List[T] = []
+    # Sql nodes can be shared between several parents, so each of them is only folded once. The original node is kept
+    # alongside its result so its id can't be reused by another object during the traversal.
+    memo: Dict[int, Tuple[Any, T]] = {}
+    while stack:
+        current, keys, values = stack.pop()
+        if keys is not None:
+            first_child = len(results) - len(keys)
+            child_results = results[first_child:]
+            del results[first_child:]
+            result = combine(current, keys, values, child_results)
+        else:
+            memoized = memo.get(id(current))
+            if memoized is not None:
+                results.append(memoized[1])
+                continue
+            expanded = expand(current)
+            if expanded is not None:
+                keys, values = expanded
+                stack.append((current, keys, values))
+                stack.extend((value, None, None) for value in reversed(values))
+                continue
+            result = leaf(current)
+        if isinstance(current, Sql):
+            memo[id(current)] = (current, result)
+        results.append(result)
+    return results[0]